@@ -43,13 +43,57 @@ final_text = post.compose()
 
 """
 
-from .manager import Draft, LinkedInManager
-from .posts import Body, CallToAction, ComposablePost, Hashtags, Hook, PostBuilder
-from .preview import LinkedInPreview
-from .registry import ComponentRegistry
-from .themes.theme_manager import THEMES, LinkedInTheme, ThemeManager
-from .tokens import EngagementTokens, StructureTokens, TextTokens
-from .variants import PostVariants, VariantResolver
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from .manager import Draft, LinkedInManager
+    from .posts import Body, CallToAction, ComposablePost, Hashtags, Hook, PostBuilder
+    from .preview import LinkedInPreview
+    from .registry import ComponentRegistry
+    from .themes.theme_manager import THEMES, LinkedInTheme, ThemeManager
+    from .tokens import EngagementTokens, StructureTokens, TextTokens
+    from .variants import PostVariants, VariantResolver
+
+# Public names are resolved on first access (PEP 562) so that importing a
+# lightweight submodule such as ``chuk_mcp_linkedin.tokens`` does not pull in
+# the manager and its artifact-store dependencies.
+_LAZY_IMPORTS: Dict[str, Tuple[str, str]] = {
+    "LinkedInManager": (".manager", "LinkedInManager"),
+    "Draft": (".manager", "Draft"),
+    "ComposablePost": (".posts", "ComposablePost"),
+    "PostBuilder": (".posts", "PostBuilder"),
+    "Hook": (".posts", "Hook"),
+    "Body": (".posts", "Body"),
+    "CallToAction": (".posts", "CallToAction"),
+    "Hashtags": (".posts", "Hashtags"),
+    "ThemeManager": (".themes.theme_manager", "ThemeManager"),
+    "LinkedInTheme": (".themes.theme_manager", "LinkedInTheme"),
+    "THEMES": (".themes.theme_manager", "THEMES"),
+    "ComponentRegistry": (".registry", "ComponentRegistry"),
+    "PostVariants": (".variants", "PostVariants"),
+    "VariantResolver": (".variants", "VariantResolver"),
+    "TextTokens": (".tokens", "TextTokens"),
+    "EngagementTokens": (".tokens", "EngagementTokens"),
+    "StructureTokens": (".tokens", "StructureTokens"),
+    "LinkedInPreview": (".preview", "LinkedInPreview"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import public names on first access"""
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __version__ = "0.1.0"
 
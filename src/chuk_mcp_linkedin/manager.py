@@ -21,15 +21,73 @@ Preview Methods:
 - generate_html_preview_async(): Generate and store preview HTML in artifacts
 """
 
-import json
+import asyncio
+import logging
+import os
+import tempfile
+import time
 import uuid
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, Set, Tuple, TypeVar, Union
 
 from chuk_artifacts import ArtifactStore
 from chuk_artifacts.config import configure_filesystem, configure_memory
-from pydantic import BaseModel, ConfigDict, Field
+from chuk_artifacts.exceptions import ArtifactStoreError
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from .preview import LinkedInPreview
+from .tokens.text_tokens import TextTokens
+
+logger = logging.getLogger(__name__)
+
+# Draft directories larger than this are read with a thread pool on load
+_PARALLEL_LOAD_THRESHOLD = 8
+_MAX_LOAD_WORKERS = 32
+
+# Maximum concurrent artifact store calls for bulk draft operations
+_ARTIFACT_STORE_CONCURRENCY = 16
+
+_T = TypeVar("_T")
+
+# Upper bound on cached artifact metadata entries per manager
+_ARTIFACT_META_CACHE_SIZE = 1024
+
+# Store-closing tasks scheduled by LinkedInManager.close(); the event loop only
+# keeps weak references to tasks, so hold them until they finish
+_closing_tasks: Set["asyncio.Task[None]"] = set()
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO 8601 string"""
+    return datetime.now().isoformat()
+
+
+async def _gather_bounded(calls: Iterable[Awaitable[_T]]) -> List[_T]:
+    """Await calls concurrently, at most _ARTIFACT_STORE_CONCURRENCY at a time"""
+    semaphore = asyncio.Semaphore(_ARTIFACT_STORE_CONCURRENCY)
+
+    async def run(call: Awaitable[_T]) -> _T:
+        async with semaphore:
+            return await call
+
+    return list(await asyncio.gather(*(run(call) for call in calls)))
+
+
+# Example payload for the DraftModel JSON schema
+_DRAFT_EXAMPLE: Dict[str, Any] = {
+    "draft_id": "draft_1_1234567890",
+    "name": "My LinkedIn Post",
+    "post_type": "text",
+    "content": {"composed_text": "Example post content..."},
+    "theme": "thought_leader",
+    "variant_config": {},
+    "created_at": "2025-01-01T12:00:00",
+    "updated_at": "2025-01-01T12:00:00",
+    "metadata": {},
+}
 
 
 class DraftModel(BaseModel):
@@ -43,34 +101,28 @@ class DraftModel(BaseModel):
     variant_config: Dict[str, Any] = Field(
         default_factory=dict, description="Variant configuration"
     )
-    created_at: str = Field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = Field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = Field(default_factory=_now_iso)
+    updated_at: str = Field(default_factory=_now_iso)
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     preview_token: str = Field(
         default_factory=lambda: uuid.uuid4().hex,
         description="Unique token for shareable preview URLs",
     )
 
+    # Drafts are mutated in place by the manager; assignments and nested
+    # instances are never revalidated
     model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "draft_id": "draft_1_1234567890",
-                "name": "My LinkedIn Post",
-                "post_type": "text",
-                "content": {"composed_text": "Example post content..."},
-                "theme": "thought_leader",
-                "variant_config": {},
-                "created_at": "2025-01-01T12:00:00",
-                "updated_at": "2025-01-01T12:00:00",
-                "metadata": {},
-            }
-        }
+        validate_assignment=False,
+        revalidate_instances="never",
+        json_schema_extra={"example": _DRAFT_EXAMPLE},
     )
 
 
 class Draft:
     """Represents a LinkedIn post draft with Pydantic validation"""
 
+    __slots__ = ("_model",)
+
     def __init__(
         self,
         draft_id: str,
@@ -80,6 +132,7 @@ class Draft:
         theme: Optional[str] = None,
         variant_config: Optional[Dict[str, Any]] = None,
     ):
+        now = _now_iso()
         self._model = DraftModel(
             draft_id=draft_id,
             name=name,
@@ -87,6 +140,8 @@ class Draft:
             content=content or {},
             theme=theme,
             variant_config=variant_config or {},
+            created_at=now,
+            updated_at=now,
         )
 
     @property
@@ -108,7 +163,7 @@ class Draft:
     def name(self, value: str) -> None:
         """Set draft name"""
         self._model.name = value
-        self._model.updated_at = datetime.now().isoformat()
+        self._model.updated_at = _now_iso()
 
     @property
     def post_type(self) -> str:
@@ -129,7 +184,7 @@ class Draft:
     def theme(self, value: Optional[str]) -> None:
         """Set theme"""
         self._model.theme = value
-        self._model.updated_at = datetime.now().isoformat()
+        self._model.updated_at = _now_iso()
 
     @property
     def variant_config(self) -> Dict[str, Any]:
@@ -166,15 +221,24 @@ class Draft:
         """Get shareable preview token"""
         return self._model.preview_token
 
+    @preview_token.setter
+    def preview_token(self, value: str) -> None:
+        """Set shareable preview token"""
+        self._model.preview_token = value
+
     def update_content(self, content: Dict[str, Any]) -> None:
         """Update draft content"""
         self._model.content.update(content)
-        self._model.updated_at = datetime.now().isoformat()
+        self._model.updated_at = _now_iso()
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert draft to dictionary"""
         return self._model.model_dump()
 
+    def to_json(self, indent: Optional[int] = None) -> str:
+        """Serialize draft to a JSON string"""
+        return self._model.model_dump_json(indent=indent)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Draft":
         """Create draft from dictionary"""
@@ -183,6 +247,14 @@ class Draft:
         draft._model = model
         return draft
 
+    @classmethod
+    def from_json(cls, data: Union[str, bytes]) -> "Draft":
+        """Create draft from JSON, parsing and validating in a single pass"""
+        model = DraftModel.model_validate_json(data)
+        draft = cls.__new__(cls)
+        draft._model = model
+        return draft
+
 
 class LinkedInManager:
     """Manager for LinkedIn post drafts with user-level isolation"""
@@ -193,6 +265,7 @@ class LinkedInManager:
         user_id: Optional[str] = None,
         use_artifacts: bool = False,
         artifact_provider: str = "memory",
+        auto_flush: bool = True,
     ):
         """
         Initialize manager with optional storage path and user ID.
@@ -202,6 +275,8 @@ class LinkedInManager:
             user_id: OAuth user ID for user-level isolation (required for multi-user deployments)
             use_artifacts: Whether to use chuk-artifacts for storage (default: False)
             artifact_provider: Storage provider if using artifacts (memory, filesystem, s3, ibm-cos)
+            auto_flush: Write drafts to storage on every change (default: True). When False,
+                changes are batched until flush() is called or the async context exits.
         """
         # User identity (from OAuth) - used for isolation
         self.user_id = user_id or "anonymous"
@@ -212,12 +287,32 @@ class LinkedInManager:
 
         self.drafts: Dict[str, Draft] = {}
         self.current_draft_id: Optional[str] = None
+        # preview_token -> draft_id, kept in step with self.drafts
+        self._token_index: Dict[str, str] = {}
+        # draft_id -> (commentary, word count); strings are immutable, so an
+        # identity match on the commentary means the count is still valid
+        self._word_counts: Dict[str, Tuple[str, int]] = {}
+        # Sequence number for the next created draft; only ever increases, so
+        # numbers are not reused after deletes
+        self._next_seq = 1
+        # Number of drafts per post type (post_type never changes after creation)
+        self._post_type_counts: Counter[str] = Counter()
+
+        # Write-through by default; batch workflows can defer writes until flush()
+        self.auto_flush = auto_flush
+        self._dirty: Set[str] = set()
 
         # Artifact storage
         self.use_artifacts = use_artifacts
         self.artifact_provider = artifact_provider
         self._artifact_store: Optional[ArtifactStore] = None
         self._artifact_initialized = False
+        # artifact_id -> metadata, least recently used first; entries are dropped
+        # when the preview they describe is replaced or its draft is deleted
+        self._artifact_meta_cache: "OrderedDict[str, Any]" = OrderedDict()
+        # draft_id -> preview artifact ID stored by this manager. Kept out of the
+        # draft metadata, which is user-controlled via import_draft
+        self._preview_artifacts: Dict[str, str] = {}
 
         # Load existing drafts
         self._load_drafts()
@@ -229,9 +324,36 @@ class LinkedInManager:
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Async context manager exit."""
-        if self._artifact_store:
-            await self._artifact_store.__aexit__(exc_type, exc_val, exc_tb)  # type: ignore[no-untyped-call]
-            self._artifact_initialized = False
+        try:
+            self.flush()
+        finally:
+            if self._artifact_store:
+                await self._artifact_store.__aexit__(exc_type, exc_val, exc_tb)  # type: ignore[no-untyped-call]
+                self._artifact_initialized = False
+                self._artifact_meta_cache.clear()
+
+    def close(self) -> None:
+        """
+        Flush pending drafts and release the artifact store from synchronous code.
+
+        Async callers should use ``async with`` instead. When called inside a running
+        event loop the store is closed in a background task.
+        """
+        try:
+            self.flush()
+        finally:
+            store = self._artifact_store
+            if store is not None and self._artifact_initialized:
+                self._artifact_initialized = False
+                self._artifact_meta_cache.clear()
+                try:
+                    loop = asyncio.get_running_loop()
+                except RuntimeError:
+                    asyncio.run(store.close())  # type: ignore[no-untyped-call]
+                else:
+                    task = loop.create_task(store.close())  # type: ignore[no-untyped-call]
+                    _closing_tasks.add(task)
+                    task.add_done_callback(_closing_tasks.discard)
 
     async def _ensure_artifact_store(self) -> None:
         """Ensure artifact store is initialized (always required for preview HTML)."""
@@ -269,7 +391,7 @@ class LinkedInManager:
         await self._ensure_artifact_store()
 
         # Serialize draft to JSON
-        draft_json = json.dumps(draft.to_dict(), indent=2)
+        draft_json = draft.to_json()
 
         # Store as artifact
         if self._artifact_store is None:
@@ -291,6 +413,36 @@ class LinkedInManager:
 
         return str(artifact_id)
 
+    async def store_drafts_as_artifacts(self, draft_ids: List[str]) -> List[Optional[str]]:
+        """
+        Store several drafts as artifacts concurrently.
+
+        Args:
+            draft_ids: Draft IDs to store
+
+        Returns:
+            Artifact IDs in the same order as draft_ids (None for drafts not stored)
+        """
+        if not self.use_artifacts:
+            return [None] * len(draft_ids)
+
+        # Initialize once up front rather than racing inside the uploads
+        await self._ensure_artifact_store()
+
+        return await _gather_bounded(
+            self.store_draft_as_artifact(draft_id) for draft_id in draft_ids
+        )
+
+    async def store_all_drafts_as_artifacts(self) -> Dict[str, Optional[str]]:
+        """
+        Store every draft as an artifact concurrently.
+
+        Returns:
+            Mapping of draft ID to artifact ID (None for drafts not stored)
+        """
+        draft_ids = list(self.drafts)
+        return dict(zip(draft_ids, await self.store_drafts_as_artifacts(draft_ids)))
+
     async def retrieve_draft_from_artifact(self, artifact_id: str) -> Optional[Draft]:
         """
         Retrieve a draft from an artifact.
@@ -316,13 +468,33 @@ class LinkedInManager:
                 return None
 
             # Deserialize draft
-            draft_data = json.loads(data.decode("utf-8"))
-            draft = Draft.from_dict(draft_data)
+            draft = Draft.from_json(data)
 
             return draft
         except Exception:
             return None
 
+    async def retrieve_drafts_from_artifacts(
+        self, artifact_ids: List[str]
+    ) -> List[Optional[Draft]]:
+        """
+        Retrieve several drafts from artifacts concurrently.
+
+        Args:
+            artifact_ids: Artifact IDs to retrieve
+
+        Returns:
+            Drafts in the same order as artifact_ids (None for any not found)
+        """
+        if not self.use_artifacts:
+            return [None] * len(artifact_ids)
+
+        await self._ensure_artifact_store()
+
+        return await _gather_bounded(
+            self.retrieve_draft_from_artifact(artifact_id) for artifact_id in artifact_ids
+        )
+
     def create_draft(
         self,
         name: str,
@@ -334,7 +506,7 @@ class LinkedInManager:
         """Create a new draft for the authenticated user"""
         # Include UUID to ensure globally unique draft IDs across all users
         # This prevents collisions when multiple users create drafts simultaneously
-        draft_id = f"draft_{len(self.drafts) + 1}_{uuid.uuid4().hex[:12]}"
+        draft_id = f"draft_{self._next_seq}_{uuid.uuid4().hex[:12]}"
 
         draft = Draft(
             draft_id=draft_id,
@@ -345,10 +517,10 @@ class LinkedInManager:
             variant_config=variant_config,
         )
 
-        self.drafts[draft_id] = draft
+        self._register_draft(draft)
         self.current_draft_id = draft_id
 
-        self._save_draft(draft)
+        self._persist(draft)
 
         return draft
 
@@ -358,10 +530,8 @@ class LinkedInManager:
 
     def get_draft_by_preview_token(self, preview_token: str) -> Optional[Draft]:
         """Get a draft by its preview token"""
-        for draft in self.drafts.values():
-            if draft.preview_token == preview_token:
-                return draft
-        return None
+        draft_id = self._token_index.get(preview_token)
+        return self.drafts.get(draft_id) if draft_id else None
 
     def get_current_draft(self) -> Optional[Draft]:
         """Get the currently active draft"""
@@ -376,21 +546,19 @@ class LinkedInManager:
         Returns:
             List of draft metadata dictionaries
         """
-        drafts_list = []
-        for draft in self.drafts.values():
-            drafts_list.append(
-                {
-                    "draft_id": draft.draft_id,
-                    "name": draft.name,
-                    "post_type": draft.post_type,
-                    "theme": draft.theme,
-                    "created_at": draft.created_at,
-                    "updated_at": draft.updated_at,
-                    "is_current": draft.draft_id == self.current_draft_id,
-                }
-            )
-
-        return drafts_list
+        current_draft_id = self.current_draft_id
+        return [
+            {
+                "draft_id": draft.draft_id,
+                "name": draft.name,
+                "post_type": draft.post_type,
+                "theme": draft.theme,
+                "created_at": draft.created_at,
+                "updated_at": draft.updated_at,
+                "is_current": draft.draft_id == current_draft_id,
+            }
+            for draft in self.drafts.values()
+        ]
 
     def switch_draft(self, draft_id: str) -> bool:
         """Switch to a different draft"""
@@ -411,23 +579,32 @@ class LinkedInManager:
         if not draft:
             return False
 
+        # Mutate in place and stamp updated_at once for the whole update
         if content:
-            draft.update_content(content)
+            draft.content.update(content)
         if theme:
             draft.theme = theme
         if variant_config:
             draft.variant_config.update(variant_config)
 
-        draft.updated_at = datetime.now().isoformat()
+        draft.updated_at = _now_iso()
 
-        self._save_draft(draft)
+        self._persist(draft)
 
         return True
 
     def delete_draft(self, draft_id: str) -> bool:
         """Delete a draft"""
         if draft_id in self.drafts:
-            self.drafts.pop(draft_id)
+            draft = self.drafts.pop(draft_id)
+            self._dirty.discard(draft_id)
+            self._word_counts.pop(draft_id, None)
+            self._post_type_counts[draft.post_type] -= 1
+            if not self._post_type_counts[draft.post_type]:
+                del self._post_type_counts[draft.post_type]
+            if self._token_index.get(draft.preview_token) == draft_id:
+                del self._token_index[draft.preview_token]
+            self._forget_preview(draft_id)
 
             # Delete from storage
             draft_file = self.storage_path / f"{draft_id}.json"
@@ -436,7 +613,7 @@ class LinkedInManager:
 
             # Update current draft if needed
             if self.current_draft_id == draft_id:
-                self.current_draft_id = next(iter(self.drafts.keys()), None)
+                self.current_draft_id = next(iter(self.drafts), None)
 
             return True
         return False
@@ -446,36 +623,53 @@ class LinkedInManager:
         count = len(self.drafts)
 
         # Delete all files
-        for draft_file in self.storage_path.glob("*.json"):
-            draft_file.unlink()
+        for draft_file in self._draft_files():
+            os.unlink(draft_file)
 
         self.drafts.clear()
+        self._token_index.clear()
+        self._preview_artifacts.clear()
+        self._artifact_meta_cache.clear()
+        self._word_counts.clear()
+        self._post_type_counts.clear()
+        self._dirty.clear()
         self.current_draft_id = None
 
         return count
 
-    def export_draft(self, draft_id: str) -> Optional[str]:
-        """Export draft as JSON string"""
+    def export_draft(self, draft_id: str, pretty: bool = False) -> Optional[str]:
+        """
+        Export draft as JSON string.
+
+        Args:
+            draft_id: Draft ID to export
+            pretty: Indent the JSON for human reading (compact by default)
+
+        Returns:
+            JSON string or None if draft not found
+        """
         draft = self.get_draft(draft_id)
         if draft:
-            return json.dumps(draft.to_dict(), indent=2)
+            return draft.to_json(indent=2 if pretty else None)
         return None
 
     def import_draft(self, draft_json: str) -> Optional[Draft]:
         """Import draft from JSON string"""
         try:
-            data = json.loads(draft_json)
-            draft = Draft.from_dict(data)
+            draft = Draft.from_json(draft_json)
 
-            # Ensure unique ID
+            # Ensure unique ID and preview token; a copy sharing the original's
+            # token would take over its preview URL
             if draft.draft_id in self.drafts:
-                draft.draft_id = f"{draft.draft_id}_{datetime.now().timestamp()}"
+                draft.draft_id = f"{draft.draft_id}_{time.time_ns()}"
+            if draft.preview_token in self._token_index:
+                draft.preview_token = uuid.uuid4().hex
 
-            self.drafts[draft.draft_id] = draft
-            self._save_draft(draft)
+            self._register_draft(draft)
+            self._persist(draft)
 
             return draft
-        except (json.JSONDecodeError, KeyError) as e:
+        except ValidationError as e:
             print(f"Error importing draft: {e}")
             return None
 
@@ -502,40 +696,115 @@ class LinkedInManager:
             return None
 
         commentary = draft.content.get("commentary", "")
-        word_count = len(commentary.split())
+        cached = self._word_counts.get(draft_id)
+        if cached is not None and cached[0] is commentary:
+            word_count = cached[1]
+        else:
+            word_count = len(commentary.split())
+            self._word_counts[draft_id] = (commentary, word_count)
         char_count = len(commentary)
 
         return {
             "draft_id": draft.draft_id,
             "word_count": word_count,
             "char_count": char_count,
-            "char_remaining": 3000 - char_count,
-            "preview_visible": min(210, char_count),
+            "char_remaining": TextTokens.MAX_LENGTH - char_count,
+            "preview_visible": min(TextTokens.TRUNCATION_POINT, char_count),
             "has_hook": draft.content.get("hook") is not None,
             "has_cta": draft.content.get("cta") is not None,
             "hashtag_count": len(draft.content.get("hashtags", [])),
         }
 
+    def _register_draft(self, draft: Draft) -> None:
+        """Add a draft to the in-memory store and the preview token index"""
+        self.drafts[draft.draft_id] = draft
+        self._token_index[draft.preview_token] = draft.draft_id
+        self._post_type_counts[draft.post_type] += 1
+
+        # Keep the sequence ahead of any draft_<n>_... ID we know about
+        prefix, _, rest = draft.draft_id.partition("_")
+        seq = rest.partition("_")[0]
+        if prefix == "draft" and seq.isdigit() and int(seq) >= self._next_seq:
+            self._next_seq = int(seq) + 1
+
+    def _persist(self, draft: Draft) -> None:
+        """Save a changed draft now, or mark it dirty when auto_flush is off"""
+        if self.auto_flush:
+            self._save_draft(draft)
+        else:
+            self._dirty.add(draft.draft_id)
+
+    def flush(self) -> int:
+        """
+        Write all pending draft changes to storage.
+
+        Returns:
+            Number of drafts written
+        """
+        written = 0
+        # Drop each draft from the pending set only once it is written, so a
+        # failed save leaves it and every later draft to be retried
+        for draft_id in list(self._dirty):
+            draft = self.drafts.get(draft_id)
+            if draft:
+                self._save_draft(draft)
+                written += 1
+            self._dirty.discard(draft_id)
+        return written
+
     def _save_draft(self, draft: Draft) -> None:
         """Save draft to storage"""
         draft_file = self.storage_path / f"{draft.draft_id}.json"
-        with open(draft_file, "w") as f:
-            json.dump(draft.to_dict(), f, indent=2)
+        # Write to a uniquely named temporary file and swap it in, so a crash never
+        # leaves a partial draft and concurrent writers never share a temp file
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.storage_path, prefix=f"{draft.draft_id}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+                tmp.write(draft.to_json())
+            os.replace(tmp_name, draft_file)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    def _draft_files(self) -> List[str]:
+        """List draft JSON file paths in storage with a single directory scan"""
+        with os.scandir(self.storage_path) as entries:
+            return [
+                entry.path for entry in entries if entry.name.endswith(".json") and entry.is_file()
+            ]
+
+    @staticmethod
+    def _read_draft_file(draft_file: str) -> Optional[Draft]:
+        """Read a single draft file, returning None if it is not a valid draft"""
+        try:
+            with open(draft_file, "rb") as f:
+                return Draft.from_json(f.read())
+        except ValidationError as e:
+            print(f"Error loading draft {draft_file}: {e}")
+            return None
 
     def _load_drafts(self) -> None:
         """Load drafts from storage"""
-        for draft_file in self.storage_path.glob("*.json"):
-            try:
-                with open(draft_file, "r") as f:
-                    data = json.load(f)
-                    draft = Draft.from_dict(data)
-                    self.drafts[draft.draft_id] = draft
-            except (json.JSONDecodeError, KeyError) as e:
-                print(f"Error loading draft {draft_file}: {e}")
+        draft_files = self._draft_files()
+
+        # File reads release the GIL, so large directories load in parallel
+        loaded: List[Optional[Draft]]
+        if len(draft_files) > _PARALLEL_LOAD_THRESHOLD:
+            workers = min(_MAX_LOAD_WORKERS, len(draft_files))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                loaded = list(executor.map(self._read_draft_file, draft_files))
+        else:
+            loaded = [self._read_draft_file(draft_file) for draft_file in draft_files]
+
+        for draft in loaded:
+            if draft is not None:
+                self._register_draft(draft)
 
         # Set first draft as current if none set
         if self.drafts and not self.current_draft_id:
-            self.current_draft_id = next(iter(self.drafts.keys()))
+            self.current_draft_id = next(iter(self.drafts))
 
     def get_info(self) -> Dict[str, Any]:
         """Get manager information"""
@@ -543,7 +812,7 @@ class LinkedInManager:
             "total_drafts": len(self.drafts),
             "current_draft_id": self.current_draft_id,
             "storage_path": str(self.storage_path),
-            "draft_types": list(set(d.post_type for d in self.drafts.values())),
+            "draft_types": list(self._post_type_counts),
         }
 
     async def generate_html_preview_async(self, draft_id: str) -> Optional[str]:
@@ -560,8 +829,6 @@ class LinkedInManager:
             User isolation is enforced automatically - each user's manager instance
             only has access to their own drafts and artifacts.
         """
-        from .preview import LinkedInPreview
-
         draft = self.get_draft(draft_id)
         if not draft:
             return None
@@ -569,8 +836,10 @@ class LinkedInManager:
         # Get stats
         stats = self.get_draft_stats(draft_id)
 
-        # Generate HTML
-        html_content = LinkedInPreview.generate_html(draft.to_dict(), stats)
+        # Generate HTML off the event loop; document previews may convert files
+        html_content = await asyncio.to_thread(
+            LinkedInPreview.generate_html, draft.to_dict(), stats
+        )
 
         # Always store as artifact
         await self._ensure_artifact_store()
@@ -590,8 +859,32 @@ class LinkedInManager:
                 "type": "preview",
             },
         )
+
+        # Remember the artifact so later reads can fetch it directly, unless the
+        # draft was deleted while the preview was being rendered or stored
+        if draft_id in self.drafts:
+            self._remember_preview(draft_id, str(artifact_id))
         return str(artifact_id)
 
+    def _remember_preview(self, draft_id: str, artifact_id: str) -> None:
+        """Record the latest preview artifact ID stored for a draft"""
+        previous = self._preview_artifacts.get(draft_id)
+        if previous and previous != artifact_id:
+            self._artifact_meta_cache.pop(previous, None)
+        self._preview_artifacts[draft_id] = artifact_id
+
+    def _forget_preview(self, draft_id: str) -> None:
+        """Drop the recorded preview artifact of a draft and its cached metadata"""
+        artifact_id = self._preview_artifacts.pop(draft_id, None)
+        if artifact_id:
+            self._artifact_meta_cache.pop(artifact_id, None)
+
+    @staticmethod
+    def _is_preview_for(meta: Any, draft_id: str) -> bool:
+        """Check artifact metadata describes the HTML preview of draft_id"""
+        fields = getattr(meta, "meta", None) or {}
+        return bool(fields.get("type") == "preview" and fields.get("draft_id") == draft_id)
+
     async def read_preview_html_async(self, draft_id: str) -> Optional[str]:
         """
         Read HTML preview content for a draft from artifact storage.
@@ -617,6 +910,22 @@ class LinkedInManager:
         if self._artifact_store is None:
             return None
 
+        # Fetch the preview this manager last stored without listing artifacts
+        preview_artifact_id = self._preview_artifacts.get(draft_id)
+        if preview_artifact_id:
+            try:
+                meta = await self._artifact_metadata(preview_artifact_id)
+                if self._is_preview_for(meta, draft_id):
+                    data = await self._artifact_store.retrieve(
+                        preview_artifact_id, user_id=self.user_id
+                    )
+                    if data:
+                        return str(data.decode("utf-8"))
+            except (ArtifactStoreError, UnicodeDecodeError) as e:
+                # Stale or expired artifact - fall back to a lookup
+                logger.debug(f"Recorded preview {preview_artifact_id} unavailable: {e}")
+            self._forget_preview(draft_id)
+
         try:
             # List all artifacts for this user
             artifacts = await self._artifact_store.list_by_session(session_id=self.user_id)
@@ -624,11 +933,14 @@ class LinkedInManager:
             # Filter for preview artifacts matching this draft_id
             for artifact in artifacts:
                 # Get metadata for this artifact
-                meta = await self._artifact_store.metadata(artifact.artifact_id)
-                if meta and meta.get("type") == "preview" and meta.get("draft_id") == draft_id:
+                meta = await self._artifact_metadata(artifact.artifact_id)
+                if meta and self._is_preview_for(meta, draft_id):
                     # Found matching preview
-                    data = await self._artifact_store.retrieve(artifact.artifact_id)
+                    data = await self._artifact_store.retrieve(
+                        artifact.artifact_id, user_id=self.user_id
+                    )
                     if data:
+                        self._remember_preview(draft_id, artifact.artifact_id)
                         return str(data.decode("utf-8"))
 
             # Preview not found in artifacts, generate it
@@ -637,7 +949,7 @@ class LinkedInManager:
                 return None
 
             # Retrieve the newly generated preview
-            data = await self._artifact_store.retrieve(new_artifact_id)
+            data = await self._artifact_store.retrieve(new_artifact_id, user_id=self.user_id)
             if data:
                 return str(data.decode("utf-8"))
 
@@ -646,6 +958,23 @@ class LinkedInManager:
 
         return None
 
+    async def _artifact_metadata(self, artifact_id: str) -> Any:
+        """Get artifact metadata, reusing earlier lookups to avoid repeat round-trips"""
+        meta = self._artifact_meta_cache.get(artifact_id)
+        if meta is not None:
+            self._artifact_meta_cache.move_to_end(artifact_id)
+            return meta
+        if self._artifact_store is None:
+            return None
+
+        meta = await self._artifact_store.metadata(artifact_id)
+        if meta:
+            self._artifact_meta_cache[artifact_id] = meta
+            if len(self._artifact_meta_cache) > _ARTIFACT_META_CACHE_SIZE:
+                # Evict the least recently used entry
+                self._artifact_meta_cache.popitem(last=False)
+        return meta
+
     async def generate_preview_url(
         self, draft_id: str, base_url: str = "http://localhost:8000", expires_in: int = 3600
     ) -> Optional[str]:
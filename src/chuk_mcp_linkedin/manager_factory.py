@@ -5,7 +5,7 @@ Provides:
 - Per-user manager instances with automatic isolation
 - Artifact-based storage by default (no local filesystem)
 - Automatic cleanup on token expiry
-- Thread-safe manager caching
+- Thread-safe manager caching, bounded to the most recently used users
 
 Usage:
     # In tools - context is automatically set by protocol handler
@@ -18,18 +18,23 @@ Usage:
         ...
 """
 
+import logging
 import threading
-from typing import Dict, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Optional
 
 from .manager import LinkedInManager
 
+logger = logging.getLogger(__name__)
+
 
 class ManagerFactory:
     """
     Factory for creating and caching per-user LinkedInManager instances.
 
     Each user (identified by user_id from OAuth) gets their own manager instance
-    with isolated storage. Managers are cached for performance.
+    with isolated storage. Managers are cached for performance, up to max_users
+    at a time with the least recently used evicted first.
 
     Security:
     - Each user_id gets a separate manager instance
@@ -42,6 +47,7 @@ class ManagerFactory:
         self,
         use_artifacts: bool = True,
         artifact_provider: str = "memory",
+        max_users: int = 1024,
     ):
         """
         Initialize the manager factory.
@@ -49,12 +55,22 @@ class ManagerFactory:
         Args:
             use_artifacts: Whether to use chuk-artifacts for storage (default: True)
             artifact_provider: Storage provider (memory, filesystem, s3, ibm-cos)
+            max_users: Maximum cached managers; least recently used are evicted.
+                Evicted managers are flushed and closed, so an evicted user's
+                next call gets a fresh manager that reloads their drafts, but
+                in-memory state such as current_draft_id is lost.
         """
         self.use_artifacts = use_artifacts
         self.artifact_provider = artifact_provider
-
-        # Cache of managers keyed by user_id
-        self._managers: Dict[str, LinkedInManager] = {}
+        self.max_users = max_users
+        # Settings shared by every manager this factory creates
+        self._manager_kwargs: Dict[str, Any] = {
+            "use_artifacts": use_artifacts,
+            "artifact_provider": artifact_provider,
+        }
+
+        # Cache of managers keyed by user_id, least recently used first
+        self._managers: "OrderedDict[str, LinkedInManager]" = OrderedDict()
         self._lock = threading.Lock()
 
     def get_manager(self, user_id: str) -> LinkedInManager:
@@ -67,16 +83,37 @@ class ManagerFactory:
         Returns:
             LinkedInManager instance scoped to this user
         """
+        # Fast path: dict lookups are atomic, so cached managers need no lock.
+        # Recency is approximate: the LRU order is only updated when the lock
+        # is free, so a busy factory never makes readers wait for it
+        manager = self._managers.get(user_id)
+        if manager is not None:
+            if self._lock.acquire(blocking=False):
+                try:
+                    if user_id in self._managers:
+                        self._managers.move_to_end(user_id)
+                finally:
+                    self._lock.release()
+            return manager
+
+        # Create new manager for this user outside the lock so one user's
+        # setup never blocks other users; if two threads race, the first
+        # stored manager wins and the other is dropped
+        manager = LinkedInManager(user_id=user_id, **self._manager_kwargs)
         with self._lock:
-            if user_id not in self._managers:
-                # Create new manager for this user
-                self._managers[user_id] = LinkedInManager(
-                    user_id=user_id,
-                    use_artifacts=self.use_artifacts,
-                    artifact_provider=self.artifact_provider,
-                )
-
-            return self._managers[user_id]
+            manager = self._managers.setdefault(user_id, manager)
+            self._managers.move_to_end(user_id)
+            evicted = []
+            while len(self._managers) > self.max_users:
+                evicted.append(self._managers.popitem(last=False)[1])
+
+        # Write out pending drafts and release stores outside the lock
+        for old_manager in evicted:
+            try:
+                old_manager.close()
+            except OSError as e:
+                logger.warning(f"Failed to flush evicted manager for {old_manager.user_id}: {e}")
+        return manager
 
     def clear_manager(self, user_id: str) -> bool:
         """
@@ -107,15 +144,21 @@ class ManagerFactory:
 
 # Global factory instance (configured in async_server.py)
 _global_factory: Optional[ManagerFactory] = None
+_global_factory_lock = threading.Lock()
 
 
 def get_factory() -> ManagerFactory:
     """Get the global manager factory instance."""
     global _global_factory
-    if _global_factory is None:
-        # Create default factory if not configured
-        _global_factory = ManagerFactory()
-    return _global_factory
+    factory = _global_factory
+    if factory is None:
+        # Create default factory if not configured; the lock makes sure
+        # threads racing on first use all share one instance
+        with _global_factory_lock:
+            if _global_factory is None:
+                _global_factory = ManagerFactory()
+            factory = _global_factory
+    return factory
 
 
 def set_factory(factory: ManagerFactory) -> None:
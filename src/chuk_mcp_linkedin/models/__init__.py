@@ -3,27 +3,71 @@
 Pydantic models for type-safe data structures.
 """
 
-from .chart_models import (
-    BarChartData,
-    ComparisonChartData,
-    MetricsChartData,
-    ProgressChartData,
-    RankingChartData,
-)
-from .content_models import (
-    BeforeAfterData,
-    BigStatData,
-    ChecklistData,
-    FeatureListData,
-    KeyTakeawayData,
-    NumberedListData,
-    PollPreviewData,
-    ProConData,
-    QuoteData,
-    StatsGridData,
-    TimelineData,
-    TipBoxData,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .chart_models import (
+        BarChartData,
+        ComparisonChartData,
+        MetricsChartData,
+        ProgressChartData,
+        RankingChartData,
+    )
+    from .content_models import (
+        BeforeAfterData,
+        BigStatData,
+        ChecklistData,
+        FeatureListData,
+        KeyTakeawayData,
+        NumberedListData,
+        PollPreviewData,
+        ProConData,
+        QuoteData,
+        StatsGridData,
+        TimelineData,
+        TipBoxData,
+    )
+
+# Model classes are resolved on first access (PEP 562) so that only the
+# models a caller actually uses pay their pydantic class-construction cost.
+_LAZY_IMPORTS: Dict[str, str] = {
+    # Chart models
+    "BarChartData": ".chart_models",
+    "MetricsChartData": ".chart_models",
+    "ComparisonChartData": ".chart_models",
+    "ProgressChartData": ".chart_models",
+    "RankingChartData": ".chart_models",
+    # Content models
+    "QuoteData": ".content_models",
+    "BigStatData": ".content_models",
+    "TimelineData": ".content_models",
+    "KeyTakeawayData": ".content_models",
+    "ProConData": ".content_models",
+    "ChecklistData": ".content_models",
+    "BeforeAfterData": ".content_models",
+    "TipBoxData": ".content_models",
+    "StatsGridData": ".content_models",
+    "PollPreviewData": ".content_models",
+    "FeatureListData": ".content_models",
+    "NumberedListData": ".content_models",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import model classes on first access"""
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     # Chart models
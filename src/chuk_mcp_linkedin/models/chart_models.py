@@ -7,12 +7,18 @@ Provides type-safe validation for chart inputs.
 
 from typing import Any, Dict
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Component inputs are built once and only read: freeze them and reject
+# unknown keys so a misspelt field fails loudly instead of being dropped.
+_MODEL_CONFIG = ConfigDict(frozen=True, extra="forbid")
 
 
 class BarChartData(BaseModel):
     """Data model for bar charts"""
 
+    model_config = _MODEL_CONFIG
+
     data: Dict[str, int] = Field(
         ...,
         description="Chart data with labels as keys and integer values",
@@ -26,14 +32,14 @@ class BarChartData(BaseModel):
     def validate_data(cls, v: Dict[str, int]) -> Dict[str, int]:
         if not v:
             raise ValueError("Chart data cannot be empty")
-        if not all(isinstance(val, int) for val in v.values()):
-            raise ValueError("All values must be integers")
         return v
 
 
 class MetricsChartData(BaseModel):
     """Data model for metrics charts with indicators"""
 
+    model_config = _MODEL_CONFIG
+
     data: Dict[str, str] = Field(
         ...,
         description="Metrics data with labels and string values (e.g., percentages)",
@@ -52,6 +58,8 @@ class MetricsChartData(BaseModel):
 class ComparisonChartData(BaseModel):
     """Data model for comparison charts"""
 
+    model_config = _MODEL_CONFIG
+
     data: Dict[str, Any] = Field(
         ...,
         description="Comparison data with 2+ options. Values can be strings or lists of points.",
@@ -75,6 +83,8 @@ class ComparisonChartData(BaseModel):
 class ProgressChartData(BaseModel):
     """Data model for progress bar charts"""
 
+    model_config = _MODEL_CONFIG
+
     data: Dict[str, int] = Field(
         ...,
         description="Progress data with labels and percentage values (0-100)",
@@ -88,8 +98,6 @@ class ProgressChartData(BaseModel):
         if not v:
             raise ValueError("Progress data cannot be empty")
         for label, value in v.items():
-            if not isinstance(value, int):
-                raise ValueError(f"Value for '{label}' must be an integer")
             if not 0 <= value <= 100:
                 raise ValueError(f"Progress value for '{label}' must be between 0-100, got {value}")
         return v
@@ -98,6 +106,8 @@ class ProgressChartData(BaseModel):
 class RankingChartData(BaseModel):
     """Data model for ranking/leaderboard charts"""
 
+    model_config = _MODEL_CONFIG
+
     data: Dict[str, str] = Field(
         ...,
         description="Ranking data with labels and description values",
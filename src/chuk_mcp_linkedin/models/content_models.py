@@ -5,14 +5,20 @@ Pydantic models for content component data structures.
 Provides type-safe validation for Quote, BigStat, Timeline, KeyTakeaway, and ProCon components.
 """
 
-from typing import Dict, List
+from typing import Dict, List, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+# Component inputs are built once and only read: freeze them and reject
+# unknown keys so a misspelt field fails loudly instead of being dropped.
+_MODEL_CONFIG = ConfigDict(frozen=True, extra="forbid")
 
 
 class QuoteData(BaseModel):
     """Data model for quote/testimonial components"""
 
+    model_config = _MODEL_CONFIG
+
     text: str = Field(..., description="Quote text", min_length=1, max_length=500)
     author: str = Field(..., description="Quote author name", min_length=1)
     source: str | None = Field(None, description="Optional source/title (e.g., 'CTO at TechCorp')")
@@ -21,6 +27,8 @@ class QuoteData(BaseModel):
 class BigStatData(BaseModel):
     """Data model for big statistic display"""
 
+    model_config = _MODEL_CONFIG
+
     number: str = Field(
         ...,
         description="The statistic number (e.g., '2.5M', '340%', '10x')",
@@ -37,16 +45,17 @@ class BigStatData(BaseModel):
 class TimelineData(BaseModel):
     """Data model for timeline/step components"""
 
+    model_config = _MODEL_CONFIG
+
     steps: Dict[str, str] = Field(
         ...,
         description="Timeline steps as key-value pairs (year/step: description)",
         examples=[{"2023": "Launched MVP", "2024": "Reached 10K users"}],
     )
     title: str | None = Field(None, description="Optional timeline title")
-    style: str = Field(
+    style: Literal["arrow", "numbered", "dated"] = Field(
         "arrow",
         description="Timeline style: 'arrow', 'numbered', 'dated'",
-        pattern="^(arrow|numbered|dated)$",
     )
 
     @field_validator("steps")
@@ -60,36 +69,39 @@ class TimelineData(BaseModel):
 class KeyTakeawayData(BaseModel):
     """Data model for key takeaway/insight box"""
 
+    model_config = _MODEL_CONFIG
+
     message: str = Field(..., description="The key takeaway message", min_length=1, max_length=500)
     title: str = Field("KEY TAKEAWAY", description="Takeaway box title", max_length=50)
-    style: str = Field(
+    style: Literal["box", "highlight", "simple"] = Field(
         "box",
         description="Display style: 'box', 'highlight', 'simple'",
-        pattern="^(box|highlight|simple)$",
     )
 
 
 class ProConData(BaseModel):
     """Data model for pros & cons comparison"""
 
+    model_config = _MODEL_CONFIG
+
     pros: List[str] = Field(..., description="List of pros/advantages", min_length=1)
     cons: List[str] = Field(..., description="List of cons/disadvantages", min_length=1)
     title: str | None = Field(None, description="Optional title for the comparison")
 
-    @field_validator("pros", "cons")
-    @classmethod
-    def validate_items(cls, v: List[str]) -> List[str]:
-        if not v:
-            raise ValueError("Must have at least one item")
-        for item in v:
-            if not item or len(item.strip()) == 0:
-                raise ValueError("Items cannot be empty")
-        return v
+    @model_validator(mode="after")
+    def validate_items(self) -> "ProConData":
+        # min_length=1 on both fields already rejects empty lists
+        for field, items in (("pros", self.pros), ("cons", self.cons)):
+            if any(not item or item.isspace() for item in items):
+                raise ValueError(f"Items in '{field}' cannot be empty")
+        return self
 
 
 class ChecklistItem(BaseModel):
     """Single checklist item"""
 
+    model_config = _MODEL_CONFIG
+
     text: str = Field(..., description="Item text", min_length=1)
     checked: bool = Field(False, description="Whether item is checked")
 
@@ -97,6 +109,8 @@ class ChecklistItem(BaseModel):
 class ChecklistData(BaseModel):
     """Data model for checklist component"""
 
+    model_config = _MODEL_CONFIG
+
     items: List[ChecklistItem] = Field(
         ...,
         description="Checklist items with text and checked status",
@@ -111,6 +125,8 @@ class ChecklistData(BaseModel):
 class BeforeAfterData(BaseModel):
     """Data model for before/after comparison"""
 
+    model_config = _MODEL_CONFIG
+
     before: List[str] = Field(..., description="List of 'before' items", min_length=1)
     after: List[str] = Field(..., description="List of 'after' items", min_length=1)
     title: str | None = Field(None, description="Optional comparison title")
@@ -119,34 +135,35 @@ class BeforeAfterData(BaseModel):
         description="Custom labels for before/after (e.g., {'before': 'Old Way', 'after': 'New Way'})",
     )
 
-    @field_validator("before", "after")
-    @classmethod
-    def validate_items(cls, v: List[str]) -> List[str]:
-        if not v:
-            raise ValueError("Must have at least one item")
-        for item in v:
-            if not item or len(item.strip()) == 0:
-                raise ValueError("Items cannot be empty")
-        return v
+    @model_validator(mode="after")
+    def validate_items(self) -> "BeforeAfterData":
+        # min_length=1 on both fields already rejects empty lists
+        for field, items in (("before", self.before), ("after", self.after)):
+            if any(not item or item.isspace() for item in items):
+                raise ValueError(f"Items in '{field}' cannot be empty")
+        return self
 
 
 class TipBoxData(BaseModel):
     """Data model for tip/note box"""
 
+    model_config = _MODEL_CONFIG
+
     message: str = Field(..., description="Tip or note message", min_length=1, max_length=500)
     title: str | None = Field(
         None, description="Optional tip box title (e.g., 'Pro Tip', 'Warning')", max_length=50
     )
-    style: str = Field(
+    style: Literal["info", "tip", "warning", "success"] = Field(
         "info",
         description="Box style: 'info', 'tip', 'warning', 'success'",
-        pattern="^(info|tip|warning|success)$",
     )
 
 
 class StatsGridData(BaseModel):
     """Data model for stats grid display"""
 
+    model_config = _MODEL_CONFIG
+
     stats: Dict[str, str] = Field(
         ...,
         description="Statistics as key-value pairs (label: value)",
@@ -167,6 +184,8 @@ class StatsGridData(BaseModel):
 class PollPreviewData(BaseModel):
     """Data model for poll preview"""
 
+    model_config = _MODEL_CONFIG
+
     question: str = Field(..., description="Poll question", min_length=1, max_length=300)
     options: List[str] = Field(..., description="Poll options", min_length=2, max_length=4)
 
@@ -177,15 +196,16 @@ class PollPreviewData(BaseModel):
             raise ValueError("Poll must have at least 2 options")
         if len(v) > 4:
             raise ValueError("Poll cannot have more than 4 options")
-        for option in v:
-            if not option or len(option.strip()) == 0:
-                raise ValueError("Poll options cannot be empty")
+        if any(not option or option.isspace() for option in v):
+            raise ValueError("Poll options cannot be empty")
         return v
 
 
 class FeatureItem(BaseModel):
     """Single feature item"""
 
+    model_config = _MODEL_CONFIG
+
     icon: str = Field("•", description="Feature icon or bullet")
     title: str = Field(..., description="Feature title", min_length=1)
     description: str | None = Field(None, description="Optional feature description")
@@ -194,6 +214,8 @@ class FeatureItem(BaseModel):
 class FeatureListData(BaseModel):
     """Data model for feature list with icons"""
 
+    model_config = _MODEL_CONFIG
+
     features: List[FeatureItem] = Field(
         ...,
         description="Features with icon, title, and optional description",
@@ -205,12 +227,13 @@ class FeatureListData(BaseModel):
 class NumberedListData(BaseModel):
     """Data model for numbered list"""
 
+    model_config = _MODEL_CONFIG
+
     items: List[str] = Field(..., description="List items", min_length=1)
     title: str | None = Field(None, description="Optional list title")
-    style: str = Field(
+    style: Literal["numbers", "emoji_numbers", "bold_numbers"] = Field(
         "numbers",
         description="Numbering style: 'numbers', 'emoji_numbers', 'bold_numbers'",
-        pattern="^(numbers|emoji_numbers|bold_numbers)$",
     )
     start: int = Field(1, description="Starting number", ge=1)
 
@@ -219,7 +242,6 @@ class NumberedListData(BaseModel):
     def validate_items(cls, v: List[str]) -> List[str]:
         if not v:
             raise ValueError("Numbered list must have at least one item")
-        for item in v:
-            if not item or len(item.strip()) == 0:
-                raise ValueError("List items cannot be empty")
+        if any(not item or item.isspace() for item in v):
+            raise ValueError("List items cannot be empty")
         return v
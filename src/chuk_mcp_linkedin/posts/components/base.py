@@ -10,6 +10,9 @@ from typing import Any, Optional
 class PostComponent(ABC):
     """Base class for all post subcomponents"""
 
+    # Subclasses declare their own __slots__ so instances carry no __dict__
+    __slots__ = ()
+
     @abstractmethod
     def render(self, theme: Optional[Any] = None) -> str:
         """Render component to text"""
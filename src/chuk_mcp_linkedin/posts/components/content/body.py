@@ -5,15 +5,20 @@ Main content body component for LinkedIn posts.
 Supports multiple structures: linear, listicle, framework, story_arc, comparison.
 """
 
-from typing import Any, Optional
+from typing import Any, Callable, Dict, Optional
 
 from ....tokens.text_tokens import TextTokens
 from ..base import PostComponent
 
+# Line prefixes that already mark a list item in listicle content
+_LIST_MARKERS = ("→", "-", "•", "✓")
+
 
 class Body(PostComponent):
     """Main content body component"""
 
+    __slots__ = ("content", "structure", "theme")
+
     def __init__(self, content: str, structure: str = "linear", theme: Optional[Any] = None):
         self.content = content
         self.structure = structure
@@ -22,16 +27,8 @@ class Body(PostComponent):
     def render(self, theme: Optional[Any] = None) -> str:
         theme = theme or self.theme
 
-        if self.structure == "listicle":
-            return self._render_listicle(theme)
-        elif self.structure == "framework":
-            return self._render_framework(theme)
-        elif self.structure == "story_arc":
-            return self._render_story_arc(theme)
-        elif self.structure == "comparison":
-            return self._render_comparison(theme)
-        else:
-            return self._render_linear(theme)
+        renderer = _STRUCTURE_RENDERERS.get(self.structure, Body._render_linear)
+        return renderer(self, theme)
 
     def _render_linear(self, theme: Optional[Any]) -> str:
         """Traditional paragraph flow"""
@@ -49,14 +46,16 @@ class Body(PostComponent):
         if theme and theme.emoji_level == "none":
             symbol = "-"
 
+        prefix = f"{symbol} "
         formatted_lines = []
         for line in lines:
-            if line.strip():
+            stripped = line.strip()
+            if stripped:
                 # Don't add symbol if line already starts with one
-                if not line.strip().startswith(("→", "-", "•", "✓")):
-                    formatted_lines.append(f"{symbol} {line.strip()}")
+                if not stripped.startswith(_LIST_MARKERS):
+                    formatted_lines.append(prefix + stripped)
                 else:
-                    formatted_lines.append(line.strip())
+                    formatted_lines.append(stripped)
 
         return "\n".join(formatted_lines)
 
@@ -85,3 +84,12 @@ class Body(PostComponent):
 
     def validate(self) -> bool:
         return len(self.content) > 0 and len(self.content) <= 2800
+
+
+# Renderer per body structure; unknown structures fall back to linear
+_STRUCTURE_RENDERERS: Dict[str, Callable[[Body, Optional[Any]], str]] = {
+    "listicle": Body._render_listicle,
+    "framework": Body._render_framework,
+    "story_arc": Body._render_story_arc,
+    "comparison": Body._render_comparison,
+}
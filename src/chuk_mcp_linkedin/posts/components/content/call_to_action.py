@@ -9,10 +9,21 @@ from typing import Any, Optional
 
 from ..base import PostComponent
 
+# Emoji prefix per CTA type, used when the theme allows emoji
+_CTA_EMOJI = {
+    "direct": "👇",
+    "curiosity": "🤔",
+    "action": "⚡",
+    "share": "🔄",
+    "soft": "💭",
+}
+
 
 class CallToAction(PostComponent):
     """Call-to-action component"""
 
+    __slots__ = ("cta_type", "text", "theme")
+
     def __init__(self, cta_type: str, text: str, theme: Optional[Any] = None):
         self.cta_type = cta_type
         self.text = text
@@ -23,14 +34,7 @@ class CallToAction(PostComponent):
 
         # Add emoji based on theme
         if theme and theme.emoji_level in ["moderate", "expressive", "heavy"]:
-            emoji_map = {
-                "direct": "👇",
-                "curiosity": "🤔",
-                "action": "⚡",
-                "share": "🔄",
-                "soft": "💭",
-            }
-            emoji = emoji_map.get(self.cta_type, "")
+            emoji = _CTA_EMOJI.get(self.cta_type, "")
             return f"{emoji} {self.text}" if emoji else self.text
 
         return self.text
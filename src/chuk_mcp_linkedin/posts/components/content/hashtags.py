@@ -13,6 +13,8 @@ from ..base import PostComponent
 class Hashtags(PostComponent):
     """Hashtag component"""
 
+    __slots__ = ("placement", "strategy", "tags", "theme")
+
     def __init__(
         self,
         tags: List[str],
@@ -36,13 +38,15 @@ class Hashtags(PostComponent):
             elif theme.hashtag_strategy == "optimal":
                 max_tags = 5
 
-        tags_to_use = self.tags[:max_tags]
+        # Only copy when truncation is actually needed (the limit depends on the render theme)
+        tags_to_use = self.tags if len(self.tags) <= max_tags else self.tags[:max_tags]
 
-        # Format
+        # Format: one join with the "#" prefix folded into the separator
+        tag_line = "#" + " #".join(tags_to_use) if tags_to_use else ""
         if self.placement == "inline":
-            return " ".join([f"#{tag}" for tag in tags_to_use])
+            return tag_line
         else:
-            return "\n\n" + " ".join([f"#{tag}" for tag in tags_to_use])
+            return "\n\n" + tag_line
 
     def validate(self) -> bool:
         return len(self.tags) > 0 and all(len(tag) > 0 for tag in self.tags)
@@ -13,6 +13,8 @@ from ..base import PostComponent
 class Hook(PostComponent):
     """Opening hook component"""
 
+    __slots__ = ("content", "hook_type", "theme")
+
     def __init__(self, hook_type: str, content: str, theme: Optional[Any] = None):
         self.hook_type = hook_type
         self.content = content
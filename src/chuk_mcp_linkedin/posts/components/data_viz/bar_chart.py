@@ -14,6 +14,8 @@ from ..base import PostComponent
 class BarChart(PostComponent):
     """Horizontal bar chart using colored emoji squares - LinkedIn-optimized"""
 
+    __slots__ = ("data", "theme", "title", "unit")
+
     def __init__(
         self,
         data: Dict[str, int],
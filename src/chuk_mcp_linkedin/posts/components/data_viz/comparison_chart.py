@@ -14,6 +14,8 @@ from ..base import PostComponent
 class ComparisonChart(PostComponent):
     """Side-by-side A vs B comparison - for contrasting options"""
 
+    __slots__ = ("data", "theme", "title")
+
     def __init__(
         self,
         data: Dict[str, Any],
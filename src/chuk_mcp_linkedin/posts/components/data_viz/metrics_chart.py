@@ -14,6 +14,8 @@ from ..base import PostComponent
 class MetricsChart(PostComponent):
     """Key metrics with emoji indicators - for KPIs and statistics"""
 
+    __slots__ = ("data", "theme", "title")
+
     def __init__(
         self,
         data: Dict[str, str],
@@ -14,6 +14,8 @@ from ..base import PostComponent
 class ProgressChart(PostComponent):
     """Progress bars for tracking completion - for project status"""
 
+    __slots__ = ("data", "theme", "title")
+
     def __init__(
         self,
         data: Dict[str, int],
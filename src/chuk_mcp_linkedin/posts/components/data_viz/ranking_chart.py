@@ -14,6 +14,8 @@ from ..base import PostComponent
 class RankingChart(PostComponent):
     """Ranked list with medals and numbers - for top lists and leaderboards"""
 
+    __slots__ = ("data", "show_medals", "theme", "title")
+
     def __init__(
         self,
         data: Dict[str, str],
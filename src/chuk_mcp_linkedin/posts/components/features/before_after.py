@@ -14,6 +14,8 @@ from ..base import PostComponent
 class BeforeAfter(PostComponent):
     """Before/After comparison - for transformation stories"""
 
+    __slots__ = ("after", "before", "labels", "theme", "title")
+
     def __init__(
         self,
         before: List[str],
@@ -14,6 +14,8 @@ from ..base import PostComponent
 class BigStat(PostComponent):
     """Big statistic display - for eye-catching numbers and key metrics"""
 
+    __slots__ = ("context", "label", "number", "theme")
+
     def __init__(
         self,
         number: str,
@@ -14,6 +14,8 @@ from ..base import PostComponent
 class Checklist(PostComponent):
     """Checklist with checkmarks - for actionable tasks"""
 
+    __slots__ = ("items", "show_progress", "theme", "title")
+
     def __init__(
         self,
         items: List[Dict[str, Any]],
@@ -55,9 +57,4 @@ class Checklist(PostComponent):
         return "\n".join(lines)
 
     def validate(self) -> bool:
-        if not self.items or len(self.items) == 0:
-            return False
-        for item in self.items:
-            if "text" not in item or not item["text"]:
-                return False
-        return True
+        return bool(self.items) and all(item.get("text") for item in self.items)
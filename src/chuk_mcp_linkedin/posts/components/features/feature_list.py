@@ -14,6 +14,8 @@ from ..base import PostComponent
 class FeatureList(PostComponent):
     """Feature list with icons - for product/service highlights"""
 
+    __slots__ = ("features", "theme", "title")
+
     def __init__(
         self,
         features: List[Dict[str, str]],
@@ -48,9 +50,6 @@ class FeatureList(PostComponent):
         return "\n".join(lines)
 
     def validate(self) -> bool:
-        if not self.features or len(self.features) == 0:
-            return False
-        for feature in self.features:
-            if "title" not in feature or not feature["title"].strip():
-                return False
-        return True
+        return bool(self.features) and all(
+            "title" in feature and feature["title"].strip() for feature in self.features
+        )
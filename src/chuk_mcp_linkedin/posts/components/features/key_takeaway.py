@@ -14,6 +14,8 @@ from ..base import PostComponent
 class KeyTakeaway(PostComponent):
     """Key takeaway/insight box - for highlighting main points, lessons, TLDR"""
 
+    __slots__ = ("message", "style", "theme", "title")
+
     def __init__(
         self,
         message: str,
@@ -14,6 +14,8 @@ from ..base import PostComponent
 class NumberedList(PostComponent):
     """Enhanced numbered list - for sequential content"""
 
+    __slots__ = ("items", "start", "style", "theme", "title")
+
     # Emoji numbers for emoji_numbers style
     EMOJI_NUMBERS = ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟"]
 
@@ -40,24 +42,19 @@ class NumberedList(PostComponent):
             lines.append(f"{emoji} {self.title.upper()}:")
             lines.append("")
 
-        # Render numbered items based on style
-        for i, item in enumerate(self.items):
-            number = self.start + i
-
-            if self.style == "emoji_numbers":
-                # Use emoji numbers (1️⃣, 2️⃣, etc.)
-                if number <= len(self.EMOJI_NUMBERS):
-                    prefix = self.EMOJI_NUMBERS[number - 1]
-                else:
-                    prefix = f"{number}."
-            elif self.style == "bold_numbers":
-                # Use bold-style numbers (not actual bold, but visual emphasis)
-                prefix = f"[{number}]"
-            else:
-                # Default: regular numbers
-                prefix = f"{number}."
-
-            lines.append(f"{prefix} {item}")
+        # Render numbered items based on style (resolved once, not per item)
+        numbered = enumerate(self.items, self.start)
+        if self.style == "emoji_numbers":
+            # Use emoji numbers (1️⃣, 2️⃣, etc.), falling back to "N." past 🔟
+            emoji_numbers = self.EMOJI_NUMBERS
+            emoji_count = len(emoji_numbers)
+            for number, item in numbered:
+                prefix = emoji_numbers[number - 1] if number <= emoji_count else f"{number}."
+                lines.append(f"{prefix} {item}")
+        else:
+            # bold_numbers: visual emphasis (not actual bold); default: regular numbers
+            template = "[{}] {}" if self.style == "bold_numbers" else "{}. {}"
+            lines.extend(template.format(number, item) for number, item in numbered)
 
         return "\n".join(lines)
 
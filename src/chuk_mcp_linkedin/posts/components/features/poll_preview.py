@@ -14,6 +14,8 @@ from ..base import PostComponent
 class PollPreview(PostComponent):
     """Poll preview - for engagement and feedback"""
 
+    __slots__ = ("options", "question", "theme")
+
     def __init__(
         self,
         question: str,
@@ -14,6 +14,8 @@ from ..base import PostComponent
 class ProCon(PostComponent):
     """Pros & Cons comparison - for decision-making, trade-offs, evaluations"""
 
+    __slots__ = ("cons", "pros", "theme", "title")
+
     def __init__(
         self,
         pros: List[str],
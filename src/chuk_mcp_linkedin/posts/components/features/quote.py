@@ -14,6 +14,8 @@ from ..base import PostComponent
 class Quote(PostComponent):
     """Quote/testimonial component - for customer quotes, testimonials, inspirational quotes"""
 
+    __slots__ = ("author", "source", "text", "theme")
+
     def __init__(
         self,
         text: str,
@@ -14,6 +14,8 @@ from ..base import PostComponent
 class StatsGrid(PostComponent):
     """Multi-stat grid display - for KPI dashboards"""
 
+    __slots__ = ("columns", "stats", "theme", "title")
+
     def __init__(
         self,
         stats: Dict[str, str],
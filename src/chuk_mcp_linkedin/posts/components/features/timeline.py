@@ -14,6 +14,8 @@ from ..base import PostComponent
 class Timeline(PostComponent):
     """Timeline/step component - for processes, journeys, historical progression"""
 
+    __slots__ = ("steps", "style", "theme", "title")
+
     def __init__(
         self,
         steps: Dict[str, str],
@@ -13,6 +13,8 @@ from ..base import PostComponent
 class TipBox(PostComponent):
     """Highlighted tip/note box - for important insights"""
 
+    __slots__ = ("message", "style", "theme", "title")
+
     # Style to emoji mapping
     STYLE_EMOJIS = {"info": "ℹ️", "tip": "💡", "warning": "⚠️", "success": "✅"}
 
@@ -14,6 +14,8 @@ from ..base import PostComponent
 class Separator(PostComponent):
     """Visual separator component"""
 
+    __slots__ = ("style",)
+
     def __init__(self, style: str = "line"):
         self.style = style
 
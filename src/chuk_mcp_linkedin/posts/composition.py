@@ -221,10 +221,14 @@ class ComposablePost:
 
     def get_preview(self, chars: int = 210) -> str:
         """Get truncated preview (what users see before 'see more')"""
-        full_text = self.compose()
-        if len(full_text) <= chars:
-            return full_text
-        return full_text[:chars] + "..."
+        return self._truncate(self.compose(), chars)
+
+    @staticmethod
+    def _truncate(text: str, chars: int) -> str:
+        """Truncate composed text to the 'see more' preview length"""
+        if len(text) <= chars:
+            return text
+        return text[:chars] + "..."
 
     def optimize_for_engagement(self) -> "ComposablePost":
         """Apply engagement optimizations"""
@@ -244,15 +248,17 @@ class ComposablePost:
 
     def to_dict(self) -> Dict[str, Any]:
         """Export as dictionary"""
+        # Compose once: each compose() re-validates and re-renders every component
+        final_text = self.compose()
         return {
             "post_type": self.post_type,
             "theme": self.theme.name if self.theme else None,
             "components": [
                 {"type": type(c).__name__, "content": c.render(self.theme)} for c in self.components
             ],
-            "final_text": self.compose(),
-            "character_count": len(self.compose()),
-            "preview": self.get_preview(),
+            "final_text": final_text,
+            "character_count": len(final_text),
+            "preview": self._truncate(final_text, 210),
         }
 
 
@@ -5,7 +5,73 @@ Component Renderer - Converts components to HTML/CSS.
 Renders visual elements, layouts, and other components as HTML for browser preview.
 """
 
-from typing import Any, Dict, List
+import io
+from typing import Any, Callable, Dict, List
+
+# Badge templates are assembled once and filled with a single format_map call
+_BADGE_DEFAULTS: Dict[str, Any] = {
+    "padding_y": 6,
+    "padding_x": 12,
+    "font_size": 18,
+    "font_weight": "600",
+    "border_radius": 999,
+}
+
+_BADGE_COMMON_STYLE = """
+display: inline-block;
+padding: {padding_y}px {padding_x}px;
+font-size: {font_size}px;
+font-weight: {font_weight};
+border-radius: {border_radius}px;
+"""
+
+_BADGE_FILL_STYLE = """
+    background-color: {background_color};
+    color: {text_color};
+"""
+
+_BADGE_STATUS_STYLE = """
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+"""
+
+_BADGE_PLAIN = '\n<span style="' + _BADGE_COMMON_STYLE + _BADGE_FILL_STYLE + '">{text}</span>\n'
+
+_BADGE_TEMPLATES: Dict[str, str] = {
+    "pill": _BADGE_PLAIN,
+    "status": (
+        '\n<span style="'
+        + _BADGE_COMMON_STYLE
+        + _BADGE_FILL_STYLE.rstrip("\n")
+        + _BADGE_STATUS_STYLE
+        + '">{text}</span>\n'
+    ),
+    "status_outlined": (
+        '\n<span style="'
+        + _BADGE_COMMON_STYLE
+        + _BADGE_FILL_STYLE
+        + "    border: {border_width}px solid {border_color};"
+        + _BADGE_STATUS_STYLE
+        + '">{text}</span>\n'
+    ),
+    "percentage_change": _BADGE_PLAIN,
+    "category_tag": _BADGE_PLAIN,
+}
+
+# CSS property per accent-border side
+_BORDER_SIDE_PROPS: Dict[str, str] = {
+    "left": "border-left",
+    "right": "border-right",
+    "top": "border-top",
+    "bottom": "border-bottom",
+}
+
+# CSS linear-gradient direction per background direction name
+_GRADIENT_DIRECTIONS: Dict[str, str] = {
+    "vertical": "to bottom",
+    "horizontal": "to right",
+    "diagonal": "to bottom right",
+}
 
 
 class ComponentRenderer:
@@ -71,62 +137,10 @@ class ComponentRenderer:
     @staticmethod
     def render_badge(badge: Dict[str, Any]) -> str:
         """Render badge component to HTML"""
-        variant = badge.get("variant", "pill")
-
-        common_style = f"""
-display: inline-block;
-padding: {badge.get("padding_y", 6)}px {badge.get("padding_x", 12)}px;
-font-size: {badge.get("font_size", 18)}px;
-font-weight: {badge.get("font_weight", "600")};
-border-radius: {badge.get("border_radius", 999)}px;
-"""
-
-        if variant == "pill":
-            return f"""
-<span style="{common_style}
-    background-color: {badge["background_color"]};
-    color: {badge["text_color"]};
-">{badge["text"]}</span>
-"""
-
-        elif variant == "status":
-            return f"""
-<span style="{common_style}
-    background-color: {badge["background_color"]};
-    color: {badge["text_color"]};
-    text-transform: uppercase;
-    letter-spacing: 0.5px;
-">{badge["text"]}</span>
-"""
-
-        elif variant == "status_outlined":
-            return f"""
-<span style="{common_style}
-    background-color: {badge["background_color"]};
-    color: {badge["text_color"]};
-    border: {badge["border_width"]}px solid {badge["border_color"]};
-    text-transform: uppercase;
-    letter-spacing: 0.5px;
-">{badge["text"]}</span>
-"""
-
-        elif variant == "percentage_change":
-            return f"""
-<span style="{common_style}
-    background-color: {badge["background_color"]};
-    color: {badge["text_color"]};
-">{badge["text"]}</span>
-"""
-
-        elif variant == "category_tag":
-            return f"""
-<span style="{common_style}
-    background-color: {badge["background_color"]};
-    color: {badge["text_color"]};
-">{badge["text"]}</span>
-"""
-
-        return ""
+        template = _BADGE_TEMPLATES.get(badge.get("variant", "pill"))
+        if template is None:
+            return ""
+        return template.format_map({**_BADGE_DEFAULTS, **badge})
 
     @staticmethod
     def render_shape(shape: Dict[str, Any]) -> str:
@@ -230,12 +244,7 @@ border-radius: {badge.get("border_radius", 999)}px;
 
         elif variant == "accent":
             side = border.get("side", "left")
-            border_prop = {
-                "left": "border-left",
-                "right": "border-right",
-                "top": "border-top",
-                "bottom": "border-bottom",
-            }.get(side, "border-left")
+            border_prop = _BORDER_SIDE_PROPS.get(side, "border-left")
 
             return f"""
 <div style="
@@ -285,12 +294,9 @@ border-radius: {badge.get("border_radius", 999)}px;
 """
 
         elif variant == "gradient":
-            direction_map = {
-                "vertical": "to bottom",
-                "horizontal": "to right",
-                "diagonal": "to bottom right",
-            }
-            direction = direction_map.get(background.get("direction", "vertical"), "to bottom")
+            direction = _GRADIENT_DIRECTIONS.get(
+                background.get("direction", "vertical"), "to bottom"
+            )
 
             return f"""
 <div style="
@@ -328,29 +334,37 @@ border-radius: {badge.get("border_radius", 999)}px;
     @staticmethod
     def render_components_grid(components: List[Dict[str, Any]], title: str = "") -> str:
         """Render multiple components in a grid"""
-        html = ""
+        out = io.StringIO()
 
         if title:
-            html += (
+            out.write(
                 f"<h2 style='margin-top: 40px; margin-bottom: 20px; color: #1a1a1a;'>{title}</h2>"
             )
 
-        html += "<div style='display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin-bottom: 40px;'>"
+        out.write(
+            "<div style='display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin-bottom: 40px;'>"
+        )
 
         for component in components:
-            comp_type = component.get("type", "unknown")
-
-            if comp_type == "divider":
-                html += f"<div>{ComponentRenderer.render_divider(component)}</div>"
-            elif comp_type == "badge":
-                html += f"<div>{ComponentRenderer.render_badge(component)}</div>"
-            elif comp_type == "shape":
-                html += f"<div>{ComponentRenderer.render_shape(component)}</div>"
-            elif comp_type == "border":
-                html += f"<div>{ComponentRenderer.render_border(component, 'Sample Content')}</div>"
-            elif comp_type == "background":
-                html += f"<div>{ComponentRenderer.render_background(component, 'Sample Content', 250, 150)}</div>"
-
-        html += "</div>"
-
-        return html
+            render = _GRID_RENDERERS.get(component.get("type", "unknown"))
+            if render is None:
+                continue
+            rendered = render(component)
+
+            out.write("<div>")
+            out.write(rendered)
+            out.write("</div>")
+
+        out.write("</div>")
+
+        return out.getvalue()
+
+
+# Grid renderer per component type (border/background get sample content and size)
+_GRID_RENDERERS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "divider": ComponentRenderer.render_divider,
+    "badge": ComponentRenderer.render_badge,
+    "shape": ComponentRenderer.render_shape,
+    "border": lambda c: ComponentRenderer.render_border(c, "Sample Content"),
+    "background": lambda c: ComponentRenderer.render_background(c, "Sample Content", 250, 150),
+}
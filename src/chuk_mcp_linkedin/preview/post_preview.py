@@ -6,115 +6,93 @@ Creates HTML previews of LinkedIn posts for local viewing.
 """
 
 import html
+import io
+import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+# Single-pass formatter for preview text: a hashtag, or a character html.escape rewrites
+_FORMAT_RE = re.compile(r"#(\w+)|[&<>\"']")
+_HTML_ESCAPES = {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
 
-class LinkedInPreview:
-    """Generate HTML previews of LinkedIn posts"""
 
-    @staticmethod
-    def generate_html(
-        draft_data: Dict[str, Any],
-        stats: Optional[Dict[str, Any]] = None,
-    ) -> str:
-        """
-        Generate HTML preview of a LinkedIn post.
+def _format_match(match: re.Match[str]) -> str:
+    """Highlight a hashtag or escape an HTML special character"""
+    tag = match.group(1)
+    if tag is not None:
+        return f'<span class="hashtag">#{tag}</span>'
+    return _HTML_ESCAPES[match.group()]
 
-        Args:
-            draft_data: Draft data dictionary
-            stats: Optional stats dictionary
 
-        Returns:
-            HTML string
-        """
-        post_type = draft_data.get("post_type", "text")
-        content = draft_data.get("content", {})
-        theme = draft_data.get("theme", "No theme")
-
-        # Extract text content
-        text_content = LinkedInPreview._extract_text_content(content)
-
-        # Check for media attachments (images, videos, document files)
-        media_html = LinkedInPreview._render_media_attachments(content)
-
-        # Generate stats section
-        stats_html = LinkedInPreview._generate_stats(stats) if stats else ""
-
-        # Generate preview
-        html_template = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>LinkedIn Post Preview - {html.escape(draft_data.get("name", "Draft"))}</title>
-    <style>
-        * {{
+# Static page stylesheet for post previews (built once at import)
+_PAGE_STYLE = """    <style>
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, 'Open Sans', 'Helvetica Neue', sans-serif;
             background: #f3f2ef;
             padding: 20px;
             color: rgba(0, 0, 0, 0.9);
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 680px;
             margin: 0 auto;
-        }}
+        }
 
-        .preview-header {{
+        .preview-header {
             background: white;
             padding: 20px;
             border-radius: 8px 8px 0 0;
             border: 1px solid #e0dfdc;
             border-bottom: none;
-        }}
+        }
 
-        .preview-header h1 {{
+        .preview-header h1 {
             font-size: 20px;
             color: #0a66c2;
             margin-bottom: 8px;
-        }}
+        }
 
-        .preview-meta {{
+        .preview-meta {
             display: flex;
             gap: 20px;
             font-size: 13px;
             color: rgba(0, 0, 0, 0.6);
             flex-wrap: wrap;
-        }}
+        }
 
-        .meta-item {{
+        .meta-item {
             display: flex;
             align-items: center;
             gap: 5px;
-        }}
+        }
 
-        .meta-label {{
+        .meta-label {
             font-weight: 600;
-        }}
+        }
 
-        .post-card {{
+        .post-card {
             background: white;
             border: 1px solid #e0dfdc;
             border-radius: 0 0 8px 8px;
             overflow: hidden;
-        }}
+        }
 
-        .post-header {{
+        .post-header {
             padding: 12px 16px;
             display: flex;
             align-items: center;
             gap: 8px;
             border-bottom: 1px solid #e0dfdc;
-        }}
+        }
 
-        .avatar {{
+        .avatar {
             width: 48px;
             height: 48px;
             border-radius: 50%;
@@ -125,31 +103,31 @@ class LinkedInPreview:
             color: white;
             font-size: 20px;
             font-weight: 600;
-        }}
+        }
 
-        .post-author {{
+        .post-author {
             flex: 1;
-        }}
+        }
 
-        .author-name {{
+        .author-name {
             font-size: 14px;
             font-weight: 600;
             color: rgba(0, 0, 0, 0.9);
-        }}
+        }
 
-        .author-headline {{
+        .author-headline {
             font-size: 12px;
             color: rgba(0, 0, 0, 0.6);
             margin-top: 2px;
-        }}
+        }
 
-        .post-timestamp {{
+        .post-timestamp {
             font-size: 12px;
             color: rgba(0, 0, 0, 0.6);
             margin-top: 4px;
-        }}
+        }
 
-        .post-type-badge {{
+        .post-type-badge {
             display: inline-block;
             background: #0a66c2;
             color: white;
@@ -159,39 +137,39 @@ class LinkedInPreview:
             font-weight: 600;
             text-transform: uppercase;
             margin-bottom: 12px;
-        }}
+        }
 
-        .post-content {{
+        .post-content {
             padding: 16px 16px 0 16px;
             font-size: 14px;
             line-height: 1.6;
             white-space: pre-wrap;
             word-wrap: break-word;
-        }}
+        }
 
-        .see-more-link {{
+        .see-more-link {
             color: #0a66c2;
             font-weight: 600;
             cursor: pointer;
-        }}
+        }
 
-        .see-more-link:hover {{
+        .see-more-link:hover {
             text-decoration: underline;
-        }}
+        }
 
-        .hashtag {{
+        .hashtag {
             color: #0a66c2;
             font-weight: 500;
-        }}
+        }
 
-        .post-actions {{
+        .post-actions {
             padding: 8px 16px;
             border-top: 1px solid #e0dfdc;
             display: flex;
             justify-content: space-around;
-        }}
+        }
 
-        .action-btn {{
+        .action-btn {
             flex: 1;
             padding: 12px;
             background: none;
@@ -205,96 +183,96 @@ class LinkedInPreview:
             justify-content: center;
             gap: 8px;
             transition: background 0.2s;
-        }}
+        }
 
-        .action-btn:hover {{
+        .action-btn:hover {
             background: rgba(0, 0, 0, 0.05);
-        }}
+        }
 
-        .stats-section {{
+        .stats-section {
             background: white;
             border: 1px solid #e0dfdc;
             border-radius: 8px;
             padding: 20px;
             margin-top: 20px;
-        }}
+        }
 
-        .stats-section h2 {{
+        .stats-section h2 {
             font-size: 16px;
             margin-bottom: 16px;
             color: rgba(0, 0, 0, 0.9);
-        }}
+        }
 
-        .stats-grid {{
+        .stats-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
             gap: 16px;
-        }}
+        }
 
-        .stat-item {{
+        .stat-item {
             padding: 12px;
             background: #f3f2ef;
             border-radius: 4px;
-        }}
+        }
 
-        .stat-label {{
+        .stat-label {
             font-size: 12px;
             color: rgba(0, 0, 0, 0.6);
             margin-bottom: 4px;
-        }}
+        }
 
-        .stat-value {{
+        .stat-value {
             font-size: 20px;
             font-weight: 600;
             color: #0a66c2;
-        }}
+        }
 
-        .stat-indicator {{
+        .stat-indicator {
             font-size: 12px;
             margin-top: 4px;
-        }}
+        }
 
-        .stat-good {{
+        .stat-good {
             color: #057642;
-        }}
+        }
 
-        .stat-warning {{
+        .stat-warning {
             color: #f5b800;
-        }}
+        }
 
-        .stat-bad {{
+        .stat-bad {
             color: #cc1016;
-        }}
+        }
 
-        .footer {{
+        .footer {
             text-align: center;
             margin-top: 20px;
             padding: 20px;
             color: rgba(0, 0, 0, 0.6);
             font-size: 12px;
-        }}
+        }
 
         /* Media attachment styles */
-        .media-attachment {{
+        .media-attachment {
             margin-top: -12px;
             border-top: none;
-        }}
+        }
 
-        .media-image {{
+        .media-image {
             width: 100%;
             display: block;
             background: #000;
-        }}
+        }
 
-        .media-video {{
+        .media-video {
             width: 100%;
             background: #000;
             position: relative;
             margin-top: -12px;
             border-top: none;
-        }}
+        }
 
-        .video-placeholder {{
+        .video-placeholder {
             width: 100%;
             aspect-ratio: 16 / 9;
             background: linear-gradient(135deg, #1a1a1a 0%, #2d2d2d 100%);
@@ -302,9 +280,9 @@ class LinkedInPreview:
             align-items: center;
             justify-content: center;
             position: relative;
-        }}
+        }
 
-        .video-play-button {{
+        .video-play-button {
             width: 80px;
             height: 80px;
             background: rgba(255, 255, 255, 0.9);
@@ -314,13 +292,13 @@ class LinkedInPreview:
             justify-content: center;
             cursor: pointer;
             transition: transform 0.2s;
-        }}
+        }
 
-        .video-play-button:hover {{
+        .video-play-button:hover {
             transform: scale(1.1);
-        }}
+        }
 
-        .video-play-button::after {{
+        .video-play-button::after {
             content: '';
             width: 0;
             height: 0;
@@ -328,9 +306,9 @@ class LinkedInPreview:
             border-top: 15px solid transparent;
             border-bottom: 15px solid transparent;
             margin-left: 8px;
-        }}
+        }
 
-        .video-duration {{
+        .video-duration {
             position: absolute;
             bottom: 12px;
             right: 12px;
@@ -340,9 +318,9 @@ class LinkedInPreview:
             border-radius: 4px;
             font-size: 12px;
             font-weight: 600;
-        }}
+        }
 
-        .document-file-card {{
+        .document-file-card {
             border-top: none;
             margin-top: -12px;
             padding: 16px;
@@ -352,13 +330,13 @@ class LinkedInPreview:
             gap: 16px;
             cursor: pointer;
             transition: background 0.2s;
-        }}
+        }
 
-        .document-file-card:hover {{
+        .document-file-card:hover {
             background: #e8e6e3;
-        }}
+        }
 
-        .document-icon {{
+        .document-icon {
             width: 48px;
             height: 48px;
             background: #fff;
@@ -369,14 +347,14 @@ class LinkedInPreview:
             justify-content: center;
             font-size: 24px;
             flex-shrink: 0;
-        }}
+        }
 
-        .document-info {{
+        .document-info {
             flex: 1;
             min-width: 0;
-        }}
+        }
 
-        .document-title {{
+        .document-title {
             font-size: 14px;
             font-weight: 600;
             color: rgba(0, 0, 0, 0.9);
@@ -384,310 +362,103 @@ class LinkedInPreview:
             white-space: nowrap;
             overflow: hidden;
             text-overflow: ellipsis;
-        }}
+        }
 
-        .document-meta {{
+        .document-meta {
             font-size: 12px;
             color: rgba(0, 0, 0, 0.6);
-        }}
+        }
 
-        .multi-image-grid {{
+        .multi-image-grid {
             display: grid;
             gap: 1px;
             background: #000;
             border-top: none;
             margin-top: -12px;
-        }}
+        }
 
-        .multi-image-grid.grid-1 {{
+        .multi-image-grid.grid-1 {
             grid-template-columns: 1fr;
-        }}
+        }
 
-        .multi-image-grid.grid-2 {{
+        .multi-image-grid.grid-2 {
             grid-template-columns: 1fr 1fr;
-        }}
+        }
 
-        .multi-image-grid.grid-3 {{
+        .multi-image-grid.grid-3 {
             grid-template-columns: 1fr 1fr;
             grid-template-rows: 200px 200px;
-        }}
+        }
 
-        .multi-image-grid.grid-3 img:first-child {{
+        .multi-image-grid.grid-3 img:first-child {
             grid-column: span 2;
             height: 200px;
-        }}
+        }
 
-        .multi-image-grid.grid-4 {{
+        .multi-image-grid.grid-4 {
             grid-template-columns: 1fr 1fr;
             grid-template-rows: 200px 200px;
-        }}
+        }
 
-        .multi-image-grid img {{
+        .multi-image-grid img {
             width: 100%;
             height: 200px;
             object-fit: cover;
             display: block;
-        }}
+        }
 
-        .multi-image-grid.grid-1 img {{
+        .multi-image-grid.grid-1 img {
             height: auto;
             max-height: 500px;
-        }}
+        }
 
-        @media (max-width: 600px) {{
-            body {{
+        @media (max-width: 600px) {
+            body {
                 padding: 10px;
-            }}
+            }
 
-            .stats-grid {{
+            .stats-grid {
                 grid-template-columns: 1fr;
-            }}
+            }
 
-            .multi-image-grid img {{
+            .multi-image-grid img {
                 height: 200px;
-            }}
-        }}
+            }
+        }
     </style>
-</head>
-<body>
-    <div class="container">
-        <div class="preview-header">
-            <h1>LinkedIn Post Preview</h1>
-            <div class="preview-meta">
-                <div class="meta-item">
-                    <span class="meta-label">Draft:</span>
-                    <span>{html.escape(draft_data.get("name", "Untitled"))}</span>
-                </div>
-                <div class="meta-item">
-                    <span class="meta-label">Type:</span>
-                    <span>{html.escape(post_type.title())}</span>
-                </div>
-                <div class="meta-item">
-                    <span class="meta-label">Theme:</span>
-                    <span>{html.escape(str(theme).replace("_", " ").title())}</span>
-                </div>
-                <div class="meta-item">
-                    <span class="meta-label">Generated:</span>
-                    <span>{datetime.now().strftime("%B %d, %Y at %I:%M %p")}</span>
-                </div>
-            </div>
-        </div>
-
-        <div class="post-card">
-            <div class="post-header">
-                <div class="avatar">Y</div>
-                <div class="post-author">
-                    <div class="author-name">Your Name</div>
-                    <div class="author-headline">Your Headline • 1st</div>
-                    <div class="post-timestamp">Just now • 🌍</div>
-                </div>
-            </div>
-
-            <div class="post-content">
-                {LinkedInPreview._format_content(text_content)}
-            </div>
-
-            {media_html}
-
-            <div class="post-actions">
-                <button class="action-btn">👍 Like</button>
-                <button class="action-btn">💬 Comment</button>
-                <button class="action-btn">🔄 Repost</button>
-                <button class="action-btn">📤 Send</button>
-            </div>
-        </div>
-
-        {stats_html}
-
-        <div class="footer">
-            Generated by chuk-mcp-linkedin | This is a preview only
-        </div>
-    </div>
-</body>
-</html>"""
-
-        return html_template
-
-    @staticmethod
-    def _render_media_attachments(content: Dict[str, Any]) -> str:
-        """Render media attachments (images, videos, document files)"""
-        media_html_parts = []
-
-        # Check for images
-        if "images" in content:
-            images = content["images"]
-            if images:
-                media_html_parts.append(LinkedInPreview._render_images(images))
-
-        # Check for video
-        if "video" in content:
-            video = content["video"]
-            if video:
-                media_html_parts.append(LinkedInPreview._render_video(video))
-
-        # Check for document file
-        if "document_file" in content:
-            doc_file = content["document_file"]
-            if doc_file:
-                media_html_parts.append(LinkedInPreview._render_document_file(doc_file))
-
-        return "\n".join(media_html_parts)
-
-    @staticmethod
-    def _render_images(images: List[Dict[str, Any]]) -> str:
-        """Render image attachments (single or multiple images)"""
-        if not images:
-            return ""
-
-        image_count = len(images)
-        grid_class = f"grid-{min(image_count, 4)}"
-
-        # For single image
-        if image_count == 1:
-            img = images[0]
-            img_path = img.get("filepath", img.get("url", ""))
-            alt_text = img.get("alt_text", "Image")
-
-            return f"""
-            <div class="media-attachment">
-                <img src="file://{img_path}" alt="{html.escape(alt_text)}" class="media-image">
-            </div>
-            """
-
-        # For multiple images
-        images_html = []
-        for img in images[:4]:  # LinkedIn max is 20, but we'll show 4 for preview
-            img_path = img.get("filepath", img.get("url", ""))
-            alt_text = img.get("alt_text", "Image")
-            images_html.append(f'<img src="file://{img_path}" alt="{html.escape(alt_text)}">')
-
-        return f"""
-        <div class="multi-image-grid {grid_class}">
-            {"".join(images_html)}
-        </div>
-        """
-
-    @staticmethod
-    def _render_video(video: Dict[str, Any]) -> str:
-        """Render video attachment with placeholder"""
-        duration = video.get("duration", "0:00")
-        thumbnail = video.get("thumbnail", "")
-
-        if thumbnail:
-            return f"""
-            <div class="media-attachment media-video">
-                <div class="video-placeholder" style="background-image: url('file://{thumbnail}'); background-size: cover;">
-                    <div class="video-play-button"></div>
-                    <div class="video-duration">{duration}</div>
-                </div>
-            </div>
-            """
-        else:
-            return f"""
-            <div class="media-attachment media-video">
-                <div class="video-placeholder">
-                    <div class="video-play-button"></div>
-                    <div class="video-duration">{duration}</div>
-                </div>
-            </div>
-            """
-
-    @staticmethod
-    def _render_document_file(doc_file: Dict[str, Any]) -> str:
-        """Render document file as carousel (like LinkedIn converts PDFs/PPTX to images)"""
-        filename = doc_file.get("filename", "Document")
-        file_type = doc_file.get("file_type", "pdf").upper()
-        filepath = doc_file.get("filepath", "")
-        pages = doc_file.get("pages", 1)
-
-        carousel_id = f"doc_carousel_{abs(hash(filename))}"
-
-        # Try to convert document to images
-        page_images = []
-        try:
-            from ..utils.document_converter import DocumentConverter
-
-            # Convert document to images (with caching)
-            page_images = DocumentConverter.convert_to_images(
-                filepath,
-                max_pages=20,  # LinkedIn limit
-                dpi=150,  # Good balance of quality and performance
-            )
-
-            # Update page count based on actual conversion
-            if page_images:
-                pages = len(page_images)
-        except Exception as e:
-            # Fall back to placeholder if conversion fails
-            print(f"Warning: Could not convert document to images: {e}")
-            page_images = []
-
-        # Generate slides (either with images or placeholders)
-        slides_html = []
-        for i in range(pages):
-            if i < len(page_images):
-                # Render with actual page image
-                page_img_path = page_images[i]
-                slides_html.append(
-                    f"""
-            <div class="carousel-item" data-slide="{i}">
-                <div class="document-page-preview">
-                    <div class="page-number">Page {i + 1} of {pages}</div>
-                    <img src="file://{page_img_path}" alt="Page {i + 1}" class="document-page-image">
-                </div>
-            </div>
-                """
-                )
-            else:
-                # Render placeholder if image not available
-                slides_html.append(
-                    f"""
-            <div class="carousel-item" data-slide="{i}">
-                <div class="document-page-preview">
-                    <div class="page-number">Page {i + 1} of {pages}</div>
-                    <div class="page-placeholder">
-                        <div class="document-icon-large">📄</div>
-                        <div class="document-filename">{html.escape(filename)}</div>
-                        <div class="page-info">{file_type} • Page {i + 1}/{pages}</div>
-                    </div>
-                </div>
-            </div>
-                """
-                )
-
-        slides_html_str = "\n".join(slides_html)
+"""
 
-        return f"""
-        <style>
-            .document-carousel {{
+# Static carousel styles shared by every document preview (built once at import)
+_DOCUMENT_CAROUSEL_STYLE = """        <style>
+            .document-carousel {
                 margin-top: -12px;
                 background: #f3f2ef;
                 border-top: none;
                 padding: 20px;
                 position: relative;
-            }}
+            }
 
-            .document-carousel .carousel-viewport {{
+            .document-carousel .carousel-viewport {
                 position: relative;
                 width: 100%;
                 overflow: hidden;
                 border-radius: 8px;
                 background: white;
-            }}
+            }
 
-            .document-carousel .carousel-track {{
+            .document-carousel .carousel-track {
                 display: flex;
                 transition: transform 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            }}
+            }
 
-            .document-carousel .carousel-item {{
+            .document-carousel .carousel-item {
                 flex: 0 0 100%;
                 display: flex;
                 justify-content: center;
                 align-items: center;
-            }}
+            }
 
-            .document-page-preview {{
+            .document-page-preview {
                 width: 100%;
                 aspect-ratio: 8.5 / 11;
                 background: white;
@@ -697,16 +468,16 @@ class LinkedInPreview:
                 align-items: center;
                 justify-content: center;
                 border: 1px solid #e0dfdc;
-            }}
+            }
 
-            .document-page-image {{
+            .document-page-image {
                 width: 100%;
                 height: 100%;
                 object-fit: contain;
                 display: block;
-            }}
+            }
 
-            .page-number {{
+            .page-number {
                 position: absolute;
                 top: 12px;
                 right: 12px;
@@ -716,46 +487,46 @@ class LinkedInPreview:
                 border-radius: 12px;
                 font-size: 11px;
                 font-weight: 600;
-            }}
+            }
 
-            .page-placeholder {{
+            .page-placeholder {
                 text-align: center;
                 padding: 40px;
-            }}
+            }
 
-            .document-icon-large {{
+            .document-icon-large {
                 font-size: 64px;
                 margin-bottom: 16px;
-            }}
+            }
 
-            .document-filename {{
+            .document-filename {
                 font-size: 14px;
                 font-weight: 600;
                 color: rgba(0, 0, 0, 0.9);
                 margin-bottom: 8px;
-            }}
+            }
 
-            .page-info {{
+            .page-info {
                 font-size: 12px;
                 color: rgba(0, 0, 0, 0.6);
-            }}
+            }
 
-            .document-carousel .carousel-nav {{
+            .document-carousel .carousel-nav {
                 position: absolute;
                 top: 50%;
                 transform: translateY(-50%);
                 z-index: 10;
-            }}
+            }
 
-            .document-carousel .carousel-nav.prev {{
+            .document-carousel .carousel-nav.prev {
                 left: 10px;
-            }}
+            }
 
-            .document-carousel .carousel-nav.next {{
+            .document-carousel .carousel-nav.next {
                 right: 10px;
-            }}
+            }
 
-            .document-carousel .carousel-nav button {{
+            .document-carousel .carousel-nav button {
                 width: 40px;
                 height: 40px;
                 border-radius: 50%;
@@ -768,53 +539,83 @@ class LinkedInPreview:
                 align-items: center;
                 justify-content: center;
                 transition: all 0.2s;
-            }}
+            }
 
-            .document-carousel .carousel-nav button:hover {{
+            .document-carousel .carousel-nav button:hover {
                 background: rgba(0, 0, 0, 0.8);
                 transform: scale(1.1);
-            }}
+            }
 
-            .document-carousel .carousel-nav button:disabled {{
+            .document-carousel .carousel-nav button:disabled {
                 opacity: 0.3;
                 cursor: not-allowed;
-            }}
+            }
 
-            .document-carousel .carousel-indicators {{
+            .document-carousel .carousel-indicators {
                 display: flex;
                 gap: 6px;
                 margin-top: 16px;
                 justify-content: center;
-            }}
+            }
 
-            .document-carousel .indicator-dot {{
+            .document-carousel .indicator-dot {
                 width: 8px;
                 height: 8px;
                 border-radius: 50%;
                 background: rgba(0, 0, 0, 0.3);
                 cursor: pointer;
                 transition: all 0.2s;
-            }}
+            }
 
-            .document-carousel .indicator-dot.active {{
+            .document-carousel .indicator-dot.active {
                 background: #0A66C2;
                 width: 24px;
                 border-radius: 4px;
-            }}
+            }
 
-            .document-carousel .slide-counter {{
+            .document-carousel .slide-counter {
                 text-align: center;
                 margin-top: 12px;
                 font-size: 13px;
                 color: #666;
                 font-weight: 500;
-            }}
+            }
         </style>
+"""
+
 
+# Per-page carousel slide templates, filled with format_map for each page
+_DOCUMENT_PAGE_IMAGE_SLIDE = """
+            <div class="carousel-item" data-slide="{index}">
+                <div class="document-page-preview">
+                    <div class="page-number">Page {page} of {pages}</div>
+                    <img src="file://{page_img_path}" alt="Page {page}" class="document-page-image">
+                </div>
+            </div>
+                """
+
+_DOCUMENT_PAGE_PLACEHOLDER_SLIDE = """
+            <div class="carousel-item" data-slide="{index}">
+                <div class="document-page-preview">
+                    <div class="page-number">Page {page} of {pages}</div>
+                    <div class="page-placeholder">
+                        <div class="document-icon-large">📄</div>
+                        <div class="document-filename">{filename}</div>
+                        <div class="page-info">{file_type} • Page {page}/{pages}</div>
+                    </div>
+                </div>
+            </div>
+                """
+
+
+# Document carousel wrapper, written around the page slides (format_map templates)
+_DOCUMENT_CAROUSEL_OPEN = """
         <div class="document-carousel" id="{carousel_id}">
             <div class="carousel-viewport">
                 <div class="carousel-track">
-                    {slides_html_str}
+                    """
+
+_DOCUMENT_CAROUSEL_CLOSE = """
                 </div>
 
                 <div class="carousel-nav prev">
@@ -827,7 +628,7 @@ class LinkedInPreview:
             </div>
 
             <div class="carousel-indicators">
-                {"".join(f'<div class="indicator-dot{"active" if i == 0 else ""}" data-slide="{i}"></div>' for i in range(pages))}
+                {indicators}
             </div>
 
             <div class="slide-counter">
@@ -897,6 +698,247 @@ class LinkedInPreview:
         </script>
         """
 
+
+class LinkedInPreview:
+    """Generate HTML previews of LinkedIn posts"""
+
+    @staticmethod
+    def generate_html(
+        draft_data: Dict[str, Any],
+        stats: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Generate HTML preview of a LinkedIn post.
+
+        Args:
+            draft_data: Draft data dictionary
+            stats: Optional stats dictionary
+
+        Returns:
+            HTML string
+        """
+        post_type = draft_data.get("post_type", "text")
+        content = draft_data.get("content", {})
+        theme = draft_data.get("theme", "No theme")
+
+        # Extract text content
+        text_content = LinkedInPreview._extract_text_content(content)
+
+        # Check for media attachments (images, videos, document files)
+        media_html = LinkedInPreview._render_media_attachments(content)
+
+        # Generate stats section
+        stats_html = LinkedInPreview._generate_stats(stats) if stats else ""
+
+        # Generate preview
+        html_template = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>LinkedIn Post Preview - {html.escape(draft_data.get("name", "Draft"))}</title>
+{_PAGE_STYLE}</head>
+<body>
+    <div class="container">
+        <div class="preview-header">
+            <h1>LinkedIn Post Preview</h1>
+            <div class="preview-meta">
+                <div class="meta-item">
+                    <span class="meta-label">Draft:</span>
+                    <span>{html.escape(draft_data.get("name", "Untitled"))}</span>
+                </div>
+                <div class="meta-item">
+                    <span class="meta-label">Type:</span>
+                    <span>{html.escape(post_type.title())}</span>
+                </div>
+                <div class="meta-item">
+                    <span class="meta-label">Theme:</span>
+                    <span>{html.escape(str(theme).replace("_", " ").title())}</span>
+                </div>
+                <div class="meta-item">
+                    <span class="meta-label">Generated:</span>
+                    <span>{datetime.now().strftime("%B %d, %Y at %I:%M %p")}</span>
+                </div>
+            </div>
+        </div>
+
+        <div class="post-card">
+            <div class="post-header">
+                <div class="avatar">Y</div>
+                <div class="post-author">
+                    <div class="author-name">Your Name</div>
+                    <div class="author-headline">Your Headline • 1st</div>
+                    <div class="post-timestamp">Just now • 🌍</div>
+                </div>
+            </div>
+
+            <div class="post-content">
+                {LinkedInPreview._format_content(text_content)}
+            </div>
+
+            {media_html}
+
+            <div class="post-actions">
+                <button class="action-btn">👍 Like</button>
+                <button class="action-btn">💬 Comment</button>
+                <button class="action-btn">🔄 Repost</button>
+                <button class="action-btn">📤 Send</button>
+            </div>
+        </div>
+
+        {stats_html}
+
+        <div class="footer">
+            Generated by chuk-mcp-linkedin | This is a preview only
+        </div>
+    </div>
+</body>
+</html>"""
+
+        return html_template
+
+    @staticmethod
+    def _render_media_attachments(content: Dict[str, Any]) -> str:
+        """Render media attachments (images, videos, document files)"""
+        media_html_parts = []
+
+        for key, render in _MEDIA_RENDERERS:
+            media = content.get(key)
+            if media:
+                media_html_parts.append(render(media))
+
+        return "\n".join(media_html_parts)
+
+    @staticmethod
+    def _render_images(images: List[Dict[str, Any]]) -> str:
+        """Render image attachments (single or multiple images)"""
+        if not images:
+            return ""
+
+        image_count = len(images)
+        grid_class = f"grid-{min(image_count, 4)}"
+
+        # For single image
+        if image_count == 1:
+            img = images[0]
+            img_path = img.get("filepath", img.get("url", ""))
+            alt_text = img.get("alt_text", "Image")
+
+            return f"""
+            <div class="media-attachment">
+                <img src="file://{img_path}" alt="{html.escape(alt_text)}" class="media-image">
+            </div>
+            """
+
+        # For multiple images
+        images_html = []
+        for img in images[:4]:  # LinkedIn max is 20, but we'll show 4 for preview
+            img_path = img.get("filepath", img.get("url", ""))
+            alt_text = img.get("alt_text", "Image")
+            images_html.append(f'<img src="file://{img_path}" alt="{html.escape(alt_text)}">')
+
+        return f"""
+        <div class="multi-image-grid {grid_class}">
+            {"".join(images_html)}
+        </div>
+        """
+
+    @staticmethod
+    def _render_video(video: Dict[str, Any]) -> str:
+        """Render video attachment with placeholder"""
+        duration = video.get("duration", "0:00")
+        thumbnail = video.get("thumbnail", "")
+
+        if thumbnail:
+            return f"""
+            <div class="media-attachment media-video">
+                <div class="video-placeholder" style="background-image: url('file://{thumbnail}'); background-size: cover;">
+                    <div class="video-play-button"></div>
+                    <div class="video-duration">{duration}</div>
+                </div>
+            </div>
+            """
+        else:
+            return f"""
+            <div class="media-attachment media-video">
+                <div class="video-placeholder">
+                    <div class="video-play-button"></div>
+                    <div class="video-duration">{duration}</div>
+                </div>
+            </div>
+            """
+
+    @staticmethod
+    def _render_document_file(doc_file: Dict[str, Any]) -> str:
+        """Render document file as carousel (like LinkedIn converts PDFs/PPTX to images)"""
+        filename = doc_file.get("filename", "Document")
+        file_type = doc_file.get("file_type", "pdf").upper()
+        filepath = doc_file.get("filepath", "")
+        pages = doc_file.get("pages", 1)
+
+        carousel_id = f"doc_carousel_{abs(hash(filename))}"
+
+        # Try to convert document to images
+        page_images = []
+        try:
+            from ..utils.document_converter import DocumentConverter
+
+            # Convert document to images (with caching)
+            page_images = DocumentConverter.convert_to_images(
+                filepath,
+                max_pages=20,  # LinkedIn limit
+                dpi=150,  # Good balance of quality and performance
+            )
+
+            # Update page count based on actual conversion
+            if page_images:
+                pages = len(page_images)
+        except Exception as e:
+            # Fall back to placeholder if conversion fails
+            print(f"Warning: Could not convert document to images: {e}")
+            page_images = []
+
+        # Stream the carousel straight into one buffer: wrapper, slides, controls
+        out = io.StringIO()
+        out.write("\n")
+        out.write(_DOCUMENT_CAROUSEL_STYLE)
+        out.write(_DOCUMENT_CAROUSEL_OPEN.format_map({"carousel_id": carousel_id}))
+
+        # Generate slides (either with images or placeholders)
+        # Fields shared by every page are resolved once, outside the loop
+        slide_fields: Dict[str, Any] = {
+            "pages": pages,
+            "filename": html.escape(filename),
+            "file_type": file_type,
+        }
+        image_count = len(page_images)
+        for i in range(pages):
+            if i:
+                out.write("\n")
+            slide_fields["index"] = i
+            slide_fields["page"] = i + 1
+            if i < image_count:
+                # Render with actual page image
+                slide_fields["page_img_path"] = page_images[i]
+                out.write(_DOCUMENT_PAGE_IMAGE_SLIDE.format_map(slide_fields))
+            else:
+                # Render placeholder if image not available
+                out.write(_DOCUMENT_PAGE_PLACEHOLDER_SLIDE.format_map(slide_fields))
+
+        out.write(
+            _DOCUMENT_CAROUSEL_CLOSE.format_map(
+                {
+                    "carousel_id": carousel_id,
+                    "pages": pages,
+                    "indicators": "".join(
+                        f'<div class="indicator-dot{"active" if i == 0 else ""}" data-slide="{i}"></div>'
+                        for i in range(pages)
+                    ),
+                }
+            )
+        )
+        return out.getvalue()
+
     @staticmethod
     def _extract_text_content(content: Dict[str, Any]) -> str:
         """Extract text content from draft content"""
@@ -931,25 +973,8 @@ class LinkedInPreview:
     @staticmethod
     def _format_content(text: str) -> str:
         """Format content with proper HTML escaping and highlighting"""
-        import re
-
-        # First, find and mark hashtags BEFORE escaping
-        # Replace hashtags with a placeholder
-        hashtag_pattern = r"#(\w+)"
-        hashtags = []
-
-        def replace_hashtag(match: re.Match[str]) -> str:
-            hashtags.append(match.group(1))
-            return f"__HASHTAG_{len(hashtags) - 1}__"
-
-        text = re.sub(hashtag_pattern, replace_hashtag, text)
-
-        # Now escape HTML (this won't affect our placeholders)
-        text = html.escape(text)
-
-        # Restore hashtags with proper HTML formatting
-        for idx, tag in enumerate(hashtags):
-            text = text.replace(f"__HASHTAG_{idx}__", f'<span class="hashtag">#{tag}</span>')
+        # Escape HTML and highlight hashtags in one pass over the raw text
+        text = _FORMAT_RE.sub(_format_match, text)
 
         # Split at 210 characters for "see more" indicator (LinkedIn's truncation point)
         if len(text) > 210:
@@ -1048,8 +1073,6 @@ class LinkedInPreview:
         Returns:
             Absolute path to saved file
         """
-        from pathlib import Path
-
         path = Path(output_path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -1057,3 +1080,11 @@ class LinkedInPreview:
             f.write(html_content)
 
         return str(path.absolute())
+
+
+# Media attachment renderers, in display order: (content key, renderer)
+_MEDIA_RENDERERS: Tuple[Tuple[str, Callable[[Any], str]], ...] = (
+    ("images", LinkedInPreview._render_images),
+    ("video", LinkedInPreview._render_video),
+    ("document_file", LinkedInPreview._render_document_file),
+)
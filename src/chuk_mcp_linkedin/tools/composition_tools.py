@@ -1216,7 +1216,7 @@ def register_composition_tools(mcp: Any) -> Dict[str, Any]:
         if not draft:
             return "No active draft"
 
-        export_json = manager.export_draft(draft.draft_id)
+        export_json = manager.export_draft(draft.draft_id, pretty=True)
         return export_json or "Export failed"
 
     # Fix array schemas after all tools are registered
@@ -61,6 +61,11 @@ class TestHashtagsRender:
         result = hashtags.render()
         assert result == "\n\n#AI #Tech"
 
+    def test_render_empty_tags(self):
+        """Test rendering an empty tag list produces no stray '#'."""
+        assert Hashtags([], placement="inline").render() == ""
+        assert Hashtags([], placement="end").render() == "\n\n"
+
     def test_render_limits_to_5_tags_default(self):
         """Test rendering limits to 5 tags by default."""
         hashtags = Hashtags(["Tag1", "Tag2", "Tag3", "Tag4", "Tag5", "Tag6", "Tag7"])
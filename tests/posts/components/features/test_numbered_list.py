@@ -40,6 +40,10 @@ class TestNumberedListRender:
         result = component.render()
         assert "[1]" in result
 
+    def test_render_numbers_with_start(self):
+        component = NumberedList(["First", "Second"], start=3)
+        assert component.render() == "3. First\n4. Second"
+
 
 class TestNumberedListValidation:
     def test_validate_valid(self):
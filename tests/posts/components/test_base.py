@@ -76,3 +76,25 @@ class TestPostComponentAbstractMethods:
         component = IncompleteComponent()
         result = component.validate()
         assert result is None
+
+
+class TestPostComponentSlots:
+    """Test that built-in components are slotted."""
+
+    def test_builtin_components_have_no_instance_dict(self):
+        """Test that every exported component declares __slots__."""
+        from chuk_mcp_linkedin.posts import components
+
+        for name in components.__all__:
+            cls = getattr(components, name)
+            if cls is PostComponent:
+                continue
+            assert "__slots__" in vars(cls), name
+
+    def test_slotted_component_rejects_unknown_attribute(self):
+        """Test that assigning an undeclared attribute raises."""
+        from chuk_mcp_linkedin.posts.components import Separator
+
+        separator = Separator("line")
+        with pytest.raises(AttributeError):
+            separator.extra = "value"
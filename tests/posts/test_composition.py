@@ -1,7 +1,10 @@
 """Tests for posts/composition module."""
 
+from unittest.mock import patch
+
 import pytest
 
+from chuk_mcp_linkedin.posts.components import Hook
 from chuk_mcp_linkedin.posts.composition import ComposablePost, PostBuilder
 
 
@@ -433,6 +436,16 @@ class TestComposablePostToDict:
         result = post.to_dict()
         assert result["theme"] == "professional"
 
+    def test_to_dict_composes_once(self):
+        """Test to_dict validates each component only once"""
+        post = ComposablePost("text")
+        post.add_hook("question", "Why?")
+        with patch.object(Hook, "validate", autospec=True, return_value=True) as validate:
+            result = post.to_dict()
+        assert validate.call_count == 1
+        assert result["character_count"] == len(result["final_text"])
+        assert result["preview"] == result["final_text"]
+
 
 class TestPostBuilder:
     """Test PostBuilder helper patterns"""
@@ -4,7 +4,9 @@ Tests for LinkedInManager and Draft.
 
 import json
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -28,6 +30,11 @@ class TestDraft:
         assert draft.post_type == "text"
         assert draft.theme == "thought_leader"
 
+    def test_draft_creation_timestamps_match(self):
+        """Test a new draft is created and updated at the same instant"""
+        draft = Draft(draft_id="draft_1", name="My Post", post_type="text")
+        assert draft.created_at == draft.updated_at
+
     def test_draft_update_content(self):
         """Test updating draft content"""
         import time
@@ -76,6 +83,19 @@ class TestDraft:
         assert draft.name == "My Post"
         assert draft.theme == "thought_leader"
 
+    def test_draft_json_round_trip(self):
+        """Test serializing a draft to JSON and back"""
+        draft = Draft(
+            draft_id="draft_1",
+            name="My Post",
+            post_type="text",
+            content={"commentary": "Caf\u00e9 \u2014 hello"},
+            theme="thought_leader",
+        )
+        restored = Draft.from_json(draft.to_json(indent=2).encode("utf-8"))
+
+        assert restored.to_dict() == draft.to_dict()
+
     def test_draft_name_setter(self):
         """Test setting draft name updates timestamp"""
         import time
@@ -118,6 +138,13 @@ class TestDraft:
         assert draft.preview_token
         assert isinstance(draft.preview_token, str)
 
+    def test_draft_uses_slots(self):
+        """Test drafts carry no per-instance __dict__"""
+        draft = Draft(draft_id="draft_1", name="Test", post_type="text")
+        assert not hasattr(draft, "__dict__")
+        with pytest.raises(AttributeError):
+            draft.unknown = "value"
+
 
 class TestLinkedInManager:
     """Test LinkedInManager class"""
@@ -163,6 +190,21 @@ class TestLinkedInManager:
         assert len(manager.drafts) == 2
         assert manager.current_draft_id == draft2.draft_id
 
+    def test_create_draft_ids_not_reused_after_delete(self, temp_storage):
+        """Test draft sequence numbers keep increasing across deletes and reloads"""
+        manager = LinkedInManager(storage_path=temp_storage)
+        first = manager.create_draft("Post 1", "text")
+        second = manager.create_draft("Post 2", "text")
+        manager.delete_draft(first.draft_id)
+
+        third = manager.create_draft("Post 3", "text")
+        assert third.draft_id.startswith("draft_3_")
+
+        reloaded = LinkedInManager(storage_path=temp_storage)
+        fourth = reloaded.create_draft("Post 4", "text")
+        assert fourth.draft_id.startswith("draft_4_")
+        assert second.draft_id.startswith("draft_2_")
+
     def test_get_draft(self, manager):
         """Test getting a draft by ID"""
         draft = manager.create_draft("My Post", "text")
@@ -280,6 +322,17 @@ class TestLinkedInManager:
         assert data["name"] == "My Post"
         assert data["theme"] == "thought_leader"
 
+    def test_export_draft_pretty(self, manager):
+        """Test exporting draft as compact or indented JSON"""
+        draft = manager.create_draft("My Post", "text", content={"text": "Hello"})
+
+        compact = manager.export_draft(draft.draft_id)
+        pretty = manager.export_draft(draft.draft_id, pretty=True)
+
+        assert "\n" not in compact
+        assert '\n  "name": "My Post"' in pretty
+        assert json.loads(compact) == json.loads(pretty)
+
     def test_export_draft_not_found(self, manager):
         """Test exporting non-existent draft"""
         json_str = manager.export_draft("nonexistent")
@@ -319,11 +372,28 @@ class TestLinkedInManager:
         draft2 = manager.import_draft(draft_json)
         assert draft2.draft_id != draft1.draft_id
 
+    def test_import_copy_gets_own_preview_token(self, manager):
+        """Test deleting an imported copy keeps the original reachable by token"""
+        original = manager.create_draft("Post 1", "text")
+
+        copy = manager.import_draft(manager.export_draft(original.draft_id))
+        assert copy.preview_token != original.preview_token
+        assert manager.get_draft_by_preview_token(copy.preview_token) is copy
+
+        manager.delete_draft(copy.draft_id)
+        assert manager.get_draft_by_preview_token(original.preview_token) is original
+
     def test_import_draft_invalid_json(self, manager):
         """Test importing invalid JSON"""
         draft = manager.import_draft("invalid json{")
         assert draft is None
 
+    def test_import_draft_missing_fields(self, manager):
+        """Test importing JSON that is not a valid draft"""
+        draft = manager.import_draft(json.dumps({"name": "No ID"}))
+        assert draft is None
+        assert manager.drafts == {}
+
     def test_get_draft_preview(self, manager):
         """Test getting draft preview"""
         draft = manager.create_draft("My Post", "text", content={"commentary": "x" * 300})
@@ -357,6 +427,18 @@ class TestLinkedInManager:
         assert stats["has_cta"] is True
         assert stats["hashtag_count"] == 2
 
+    def test_get_draft_stats_tracks_commentary_changes(self, manager):
+        """Test cached word counts follow commentary updates"""
+        draft = manager.create_draft("My Post", "text", content={"commentary": "one two"})
+        assert manager.get_draft_stats(draft.draft_id)["word_count"] == 2
+        assert manager.get_draft_stats(draft.draft_id)["word_count"] == 2
+
+        manager.update_draft(draft.draft_id, content={"commentary": "one two three"})
+        assert manager.get_draft_stats(draft.draft_id)["word_count"] == 3
+
+        draft.content["commentary"] = "just one"
+        assert manager.get_draft_stats(draft.draft_id)["word_count"] == 2
+
     def test_get_draft_stats_not_found(self, manager):
         """Test getting stats of non-existent draft"""
         stats = manager.get_draft_stats("nonexistent")
@@ -373,6 +455,19 @@ class TestLinkedInManager:
         assert "text" in info["draft_types"]
         assert "poll" in info["draft_types"]
 
+    def test_get_info_tracks_deletes(self, manager):
+        """Test draft types drop out once their last draft is deleted"""
+        text_draft = manager.create_draft("Post 1", "text")
+        manager.create_draft("Post 2", "text")
+        poll_draft = manager.create_draft("Post 3", "poll")
+
+        manager.delete_draft(poll_draft.draft_id)
+        manager.delete_draft(text_draft.draft_id)
+        assert manager.get_info()["draft_types"] == ["text"]
+
+        manager.clear_all_drafts()
+        assert manager.get_info()["draft_types"] == []
+
     def test_persistence(self, temp_storage):
         """Test drafts persist across manager instances"""
         # Create drafts with first manager
@@ -388,6 +483,16 @@ class TestLinkedInManager:
         assert draft1.draft_id in manager2.drafts
         assert draft2.draft_id in manager2.drafts
 
+    def test_persistence_many_drafts(self, temp_storage):
+        """Test large draft directories load completely"""
+        manager1 = LinkedInManager(storage_path=temp_storage)
+        created = {manager1.create_draft(f"Post {i}", "text").draft_id for i in range(20)}
+        (Path(temp_storage) / "corrupted.json").write_text("invalid json{")
+
+        manager2 = LinkedInManager(storage_path=temp_storage)
+
+        assert set(manager2.drafts) == created
+
     def test_save_and_load_preserves_data(self, temp_storage):
         """Test save and load preserves all draft data"""
         manager1 = LinkedInManager(storage_path=temp_storage)
@@ -434,6 +539,99 @@ class TestLinkedInManager:
         preview = manager.get_draft_preview(draft.draft_id, chars=210)
         assert preview == "Short"
 
+    def test_load_and_clear_ignore_non_draft_entries(self, temp_storage):
+        """Test directory scans only pick up regular *.json files"""
+        manager1 = LinkedInManager(storage_path=temp_storage)
+        manager1.create_draft("Valid Post", "text")
+        (Path(temp_storage) / "nested.json").mkdir()
+        (Path(temp_storage) / "notes.txt").write_text("not a draft")
+
+        manager2 = LinkedInManager(storage_path=temp_storage)
+        assert len(manager2.drafts) == 1
+
+        assert manager2.clear_all_drafts() == 1
+        remaining = sorted(p.name for p in Path(temp_storage).iterdir())
+        assert remaining == ["nested.json", "notes.txt"]
+
+    def test_save_draft_replaces_file_atomically(self, temp_storage):
+        """Test saving a draft leaves only the final JSON file behind"""
+        manager = LinkedInManager(storage_path=temp_storage)
+        draft = manager.create_draft("My Post", "text")
+        manager.update_draft(draft.draft_id, content={"commentary": "Updated"})
+
+        files = sorted(p.name for p in Path(temp_storage).iterdir())
+        assert files == [f"{draft.draft_id}.json"]
+        saved = json.loads((Path(temp_storage) / files[0]).read_text())
+        assert saved["content"]["commentary"] == "Updated"
+
+    def test_failed_save_removes_temp_file(self, temp_storage, monkeypatch):
+        """Test a write error leaves neither a temp file nor a partial draft"""
+        manager = LinkedInManager(storage_path=temp_storage, auto_flush=False)
+        draft = manager.create_draft("My Post", "text")
+        monkeypatch.setattr(Draft, "to_json", MagicMock(side_effect=OSError("disk full")))
+
+        with pytest.raises(OSError):
+            manager._save_draft(draft)
+
+        assert list(Path(temp_storage).iterdir()) == []
+
+    def test_concurrent_saves_of_one_draft(self, temp_storage):
+        """Test two managers saving the same draft at once never share a temp file"""
+        manager1 = LinkedInManager(storage_path=temp_storage)
+        draft = manager1.create_draft("My Post", "text")
+        manager2 = LinkedInManager(storage_path=temp_storage)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(
+                executor.map(
+                    lambda i: (manager1 if i % 2 else manager2)._save_draft(draft), range(64)
+                )
+            )
+
+        files = sorted(p.name for p in Path(temp_storage).iterdir())
+        assert files == [f"{draft.draft_id}.json"]
+
+    def test_deferred_saves_flush(self, temp_storage):
+        """Test auto_flush=False batches writes until flush()"""
+        manager = LinkedInManager(storage_path=temp_storage, auto_flush=False)
+        draft = manager.create_draft("My Post", "text")
+        manager.update_draft(draft.draft_id, content={"commentary": "Updated"})
+        deleted = manager.create_draft("Deleted", "text")
+        manager.delete_draft(deleted.draft_id)
+
+        assert list(Path(temp_storage).iterdir()) == []
+
+        assert manager.flush() == 1
+        assert manager.flush() == 0
+
+        reloaded = LinkedInManager(storage_path=temp_storage)
+        assert reloaded.get_draft(draft.draft_id).content["commentary"] == "Updated"
+
+    def test_failed_flush_keeps_unwritten_drafts_pending(self, temp_storage, monkeypatch):
+        """Test a save error leaves unwritten drafts queued for the next flush"""
+        manager = LinkedInManager(storage_path=temp_storage, auto_flush=False)
+        for i in range(3):
+            manager.create_draft(f"Post {i}", "text")
+
+        save_draft = manager._save_draft
+        calls = []
+
+        def failing_save(draft):
+            calls.append(draft.draft_id)
+            if len(calls) == 2:
+                raise OSError("disk full")
+            save_draft(draft)
+
+        monkeypatch.setattr(manager, "_save_draft", failing_save)
+        with pytest.raises(OSError):
+            manager.flush()
+
+        # Only the first save succeeded; the failed draft and the rest stay pending
+        assert manager._dirty == set(manager.drafts) - {calls[0]}
+        monkeypatch.setattr(manager, "_save_draft", save_draft)
+        assert manager.flush() == 2
+        assert len(list(Path(temp_storage).glob("*.json"))) == 3
+
     def test_load_drafts_with_corrupted_file(self, temp_storage):
         """Test loading drafts skips corrupted files"""
         manager1 = LinkedInManager(storage_path=temp_storage)
@@ -448,6 +646,16 @@ class TestLinkedInManager:
         manager2 = LinkedInManager(storage_path=temp_storage)
         assert len(manager2.drafts) == 1  # Only the valid draft loaded
 
+    def test_load_drafts_skips_invalid_draft(self, temp_storage):
+        """Test loading drafts skips well-formed JSON that is not a valid draft"""
+        manager1 = LinkedInManager(storage_path=temp_storage)
+        manager1.create_draft("Valid Post", "text")
+
+        (Path(temp_storage) / "incomplete.json").write_text(json.dumps({"name": "No ID"}))
+
+        manager2 = LinkedInManager(storage_path=temp_storage)
+        assert len(manager2.drafts) == 1
+
     def test_user_id_generation(self, temp_storage):
         """Test that manager has a user ID"""
         manager = LinkedInManager(storage_path=temp_storage)
@@ -483,6 +691,29 @@ class TestLinkedInManager:
         found_draft = manager.get_draft_by_preview_token("invalid-token-123")
         assert found_draft is None
 
+    def test_get_draft_by_preview_token_after_reload(self, temp_storage):
+        """Test preview tokens resolve for drafts loaded from storage"""
+        draft = LinkedInManager(storage_path=temp_storage).create_draft("Post 1", "text")
+
+        manager = LinkedInManager(storage_path=temp_storage)
+        found_draft = manager.get_draft_by_preview_token(draft.preview_token)
+        assert found_draft is not None
+        assert found_draft.draft_id == draft.draft_id
+
+    def test_get_draft_by_preview_token_tracks_import_and_delete(self, manager):
+        """Test the preview token index follows imports, deletes and clears"""
+        draft = manager.create_draft("Post 1", "text")
+        token = draft.preview_token
+
+        manager.delete_draft(draft.draft_id)
+        assert manager.get_draft_by_preview_token(token) is None
+
+        imported = manager.import_draft(draft.to_json())
+        assert manager.get_draft_by_preview_token(token) is imported
+
+        manager.clear_all_drafts()
+        assert manager.get_draft_by_preview_token(token) is None
+
     def test_user_isolation(self, temp_storage):
         """Test that different users have isolated drafts"""
         # User 1 creates drafts
@@ -552,6 +783,86 @@ class TestLinkedInManagerWithArtifacts:
             artifact_id = await manager.store_draft_as_artifact(draft.draft_id)
             assert artifact_id is not None
 
+    @pytest.mark.asyncio
+    async def test_store_drafts_as_artifacts(self, tmp_path):
+        """Test storing several drafts as artifacts in one call"""
+        async with LinkedInManager(
+            storage_path=str(tmp_path), use_artifacts=True, artifact_provider="memory"
+        ) as manager:
+            drafts = [manager.create_draft(f"Draft {i}", "text") for i in range(3)]
+            draft_ids = [d.draft_id for d in drafts] + ["nonexistent"]
+
+            artifact_ids = await manager.store_drafts_as_artifacts(draft_ids)
+
+            assert len(artifact_ids) == 4
+            assert artifact_ids[3] is None
+            for draft, artifact_id in zip(drafts, artifact_ids):
+                retrieved = await manager.retrieve_draft_from_artifact(artifact_id)
+                assert retrieved.draft_id == draft.draft_id
+
+    @pytest.mark.asyncio
+    async def test_store_all_drafts_and_retrieve_in_bulk(self, tmp_path):
+        """Test storing every draft and retrieving them back concurrently"""
+        async with LinkedInManager(
+            storage_path=str(tmp_path), use_artifacts=True, artifact_provider="memory"
+        ) as manager:
+            drafts = [manager.create_draft(f"Draft {i}", "text") for i in range(3)]
+
+            stored = await manager.store_all_drafts_as_artifacts()
+            assert list(stored) == [d.draft_id for d in drafts]
+
+            artifact_ids = [stored[d.draft_id] for d in drafts] + ["nonexistent"]
+            retrieved = await manager.retrieve_drafts_from_artifacts(artifact_ids)
+
+            assert [r.draft_id for r in retrieved[:3]] == [d.draft_id for d in drafts]
+            assert retrieved[3] is None
+
+    @pytest.mark.asyncio
+    async def test_store_drafts_as_artifacts_disabled(self, tmp_path):
+        """Test bulk artifact storage is a no-op when artifacts are disabled"""
+        manager = LinkedInManager(storage_path=str(tmp_path), use_artifacts=False)
+        assert await manager.store_drafts_as_artifacts(["a", "b"]) == [None, None]
+        assert await manager.retrieve_drafts_from_artifacts(["a"]) == [None]
+
+    @pytest.mark.asyncio
+    async def test_deferred_saves_flush_on_exit(self):
+        """Test pending draft changes are written when the context exits"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            async with LinkedInManager(storage_path=tmpdir, auto_flush=False) as manager:
+                draft = manager.create_draft("My Post", "text")
+
+            assert (Path(tmpdir) / f"{draft.draft_id}.json").exists()
+
+    def test_close_flushes_and_closes_store_without_event_loop(self, tmp_path):
+        """Test close() from synchronous code writes pending drafts and closes the store"""
+        import asyncio
+
+        manager = LinkedInManager(storage_path=str(tmp_path), auto_flush=False)
+        asyncio.run(manager._ensure_artifact_store())
+        draft = manager.create_draft("My Post", "text")
+
+        manager.close()
+
+        assert (tmp_path / f"{draft.draft_id}.json").exists()
+        assert manager._artifact_store._closed
+        assert manager._artifact_initialized is False
+
+    @pytest.mark.asyncio
+    async def test_exit_closes_artifact_store_when_flush_fails(self, tmp_path):
+        """Test the artifact store is closed even if the final flush raises"""
+        from unittest.mock import MagicMock
+
+        with pytest.raises(OSError):
+            async with LinkedInManager(
+                storage_path=str(tmp_path), use_artifacts=True, auto_flush=False
+            ) as manager:
+                store = manager._artifact_store
+                manager.create_draft("My Post", "text")
+                manager._save_draft = MagicMock(side_effect=OSError("disk full"))
+
+        assert store._closed
+        assert manager._artifact_initialized is False
+
     @pytest.mark.asyncio
     async def test_store_nonexistent_draft_as_artifact(self):
         """Test storing non-existent draft as artifact"""
@@ -692,6 +1003,177 @@ class TestLinkedInManagerWithArtifacts:
             # Should generate new preview since no matching artifact found
             assert result is None
 
+    @pytest.mark.asyncio
+    async def test_read_preview_html_uses_recorded_artifact(self, tmp_path):
+        """Test reading a generated preview does not list the user's artifacts"""
+        async with LinkedInManager(
+            storage_path=str(tmp_path), use_artifacts=True, artifact_provider="memory"
+        ) as manager:
+            draft = manager.create_draft("Test", "text", content={"commentary": "Hello"})
+
+            artifact_id = await manager.generate_html_preview_async(draft.draft_id)
+            assert manager._preview_artifacts[draft.draft_id] == artifact_id
+            assert "preview_artifact_id" not in draft.metadata
+
+            from unittest.mock import AsyncMock
+
+            manager._artifact_store.list_by_session = AsyncMock(side_effect=Exception("unused"))
+
+            result = await manager.read_preview_html_async(draft.draft_id)
+            assert result is not None
+            assert "Hello" in result
+            manager._artifact_store.list_by_session.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_read_preview_html_ignores_artifact_id_in_draft_metadata(self, tmp_path):
+        """Test an imported draft cannot point preview reads at another artifact"""
+        async with LinkedInManager(
+            storage_path=str(tmp_path), use_artifacts=True, artifact_provider="memory"
+        ) as manager:
+            foreign_id = await manager._artifact_store.store(
+                data=b"<html>secret</html>",
+                mime="text/html",
+                summary="Preview: other",
+                filename="previews/other.html",
+                user_id="someone-else",
+                meta={"draft_id": "other", "type": "preview"},
+            )
+            source = manager.create_draft("Test", "text", content={"commentary": "Mine"})
+            draft_json = manager.export_draft(source.draft_id)
+            manager.delete_draft(source.draft_id)
+            draft = manager.import_draft(
+                draft_json.replace(
+                    '"metadata":{}', f'"metadata":{{"preview_artifact_id":"{foreign_id}"}}'
+                )
+            )
+            assert draft.metadata["preview_artifact_id"] == foreign_id
+
+            result = await manager.read_preview_html_async(draft.draft_id)
+
+            assert "secret" not in result
+            assert "Mine" in result
+
+    @pytest.mark.asyncio
+    async def test_read_preview_html_rejects_non_preview_artifact(self, tmp_path):
+        """Test a recorded artifact is only returned if it is this draft's preview"""
+        async with LinkedInManager(
+            storage_path=str(tmp_path), use_artifacts=True, artifact_provider="memory"
+        ) as manager:
+            draft = manager.create_draft("Test", "text", content={"commentary": "Hello"})
+            other_id = await manager._artifact_store.store(
+                data=b"not a preview",
+                mime="text/plain",
+                summary="Other",
+                user_id=manager.user_id,
+                meta={"draft_id": draft.draft_id, "type": "draft"},
+            )
+            manager._remember_preview(draft.draft_id, other_id)
+
+            result = await manager.read_preview_html_async(draft.draft_id)
+
+            assert result != "not a preview"
+            assert "Hello" in result
+            assert manager._preview_artifacts[draft.draft_id] != other_id
+
+    @pytest.mark.asyncio
+    async def test_read_preview_html_recorded_artifact_missing(self, tmp_path):
+        """Test a missing recorded preview falls back while other errors propagate"""
+        async with LinkedInManager(
+            storage_path=str(tmp_path), use_artifacts=True, artifact_provider="memory"
+        ) as manager:
+            draft = manager.create_draft("Test", "text", content={"commentary": "Hello"})
+            manager._remember_preview(draft.draft_id, "missing-artifact")
+
+            result = await manager.read_preview_html_async(draft.draft_id)
+            assert "Hello" in result
+            assert manager._preview_artifacts[draft.draft_id] != "missing-artifact"
+
+            manager._artifact_store.metadata = MagicMock(side_effect=TypeError("bug"))
+            manager._artifact_meta_cache.clear()
+            with pytest.raises(TypeError):
+                await manager.read_preview_html_async(draft.draft_id)
+
+    @pytest.mark.asyncio
+    async def test_generate_preview_for_draft_deleted_meanwhile(self, tmp_path, monkeypatch):
+        """Test a preview finished after its draft was deleted is not recorded"""
+        from chuk_mcp_linkedin.preview import LinkedInPreview
+
+        async with LinkedInManager(
+            storage_path=str(tmp_path), use_artifacts=True, artifact_provider="memory"
+        ) as manager:
+            draft = manager.create_draft("Test", "text")
+            generate_html = LinkedInPreview.generate_html
+
+            def generate_and_delete(*args):
+                manager.delete_draft(draft.draft_id)
+                return generate_html(*args)
+
+            monkeypatch.setattr(LinkedInPreview, "generate_html", generate_and_delete)
+
+            assert await manager.generate_html_preview_async(draft.draft_id) is not None
+            assert draft.draft_id not in manager._preview_artifacts
+
+    @pytest.mark.asyncio
+    async def test_artifact_metadata_is_cached(self, tmp_path):
+        """Test artifact metadata lookups are only fetched once per artifact"""
+        async with LinkedInManager(
+            storage_path=str(tmp_path), use_artifacts=True, artifact_provider="memory"
+        ) as manager:
+            draft = manager.create_draft("Test", "text")
+            artifact_id = await manager.generate_html_preview_async(draft.draft_id)
+
+            from unittest.mock import AsyncMock
+
+            store = manager._artifact_store
+            store.metadata = AsyncMock(wraps=store.metadata)
+
+            first = await manager._artifact_metadata(artifact_id)
+            second = await manager._artifact_metadata(artifact_id)
+
+            assert first.artifact_id == artifact_id
+            assert second is first
+            assert store.metadata.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_artifact_metadata_cache_evicts_least_recently_used(self, monkeypatch, tmp_path):
+        """Test a cache hit keeps an entry from being evicted next"""
+        from unittest.mock import AsyncMock
+
+        from chuk_mcp_linkedin import manager as manager_module
+
+        monkeypatch.setattr(manager_module, "_ARTIFACT_META_CACHE_SIZE", 2)
+        manager = LinkedInManager(storage_path=str(tmp_path), use_artifacts=True)
+        manager._artifact_store = AsyncMock()
+        manager._artifact_store.metadata = AsyncMock(side_effect=lambda artifact_id: artifact_id)
+
+        await manager._artifact_metadata("a")
+        await manager._artifact_metadata("b")
+        await manager._artifact_metadata("a")
+        await manager._artifact_metadata("c")
+
+        assert list(manager._artifact_meta_cache) == ["a", "c"]
+
+    @pytest.mark.asyncio
+    async def test_artifact_metadata_cache_drops_replaced_and_deleted_previews(self, tmp_path):
+        """Test cached metadata goes away with the preview it describes"""
+        async with LinkedInManager(
+            storage_path=str(tmp_path), use_artifacts=True, artifact_provider="memory"
+        ) as manager:
+            draft = manager.create_draft("Test", "text", content={"commentary": "Hello"})
+            first_id = await manager.generate_html_preview_async(draft.draft_id)
+            await manager.read_preview_html_async(draft.draft_id)
+            assert first_id in manager._artifact_meta_cache
+
+            second_id = await manager.generate_html_preview_async(draft.draft_id)
+            assert first_id not in manager._artifact_meta_cache
+
+            await manager.read_preview_html_async(draft.draft_id)
+            assert second_id in manager._artifact_meta_cache
+
+            manager.delete_draft(draft.draft_id)
+            assert second_id not in manager._artifact_meta_cache
+            assert draft.draft_id not in manager._preview_artifacts
+
     @pytest.mark.asyncio
     async def test_read_preview_html_exception_handling(self):
         """Test reading preview HTML handles exceptions gracefully"""
@@ -1,7 +1,11 @@
 """Tests for manager factory module."""
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
+from chuk_mcp_linkedin import manager_factory
 from chuk_mcp_linkedin.manager import LinkedInManager
 from chuk_mcp_linkedin.manager_factory import (
     ManagerFactory,
@@ -12,6 +16,12 @@ from chuk_mcp_linkedin.manager_factory import (
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_global_factory(monkeypatch):
+    """Start each test without a global factory and restore it afterwards"""
+    monkeypatch.setattr(manager_factory, "_global_factory", None)
+
+
 class TestManagerFactory:
     """Test ManagerFactory class"""
 
@@ -168,17 +178,79 @@ class TestManagerFactory:
         manager = factory.get_manager("test_user")
         assert manager is not None
 
+    def test_get_manager_evicts_least_recently_used(self):
+        """Test the manager cache is bounded by max_users"""
+        factory = ManagerFactory(max_users=2)
+
+        manager1 = factory.get_manager("user1")
+        factory.get_manager("user2")
+        # Touch user1 so user2 becomes the least recently used
+        assert factory.get_manager("user1") is manager1
+        factory.get_manager("user3")
+
+        assert sorted(factory.get_active_users()) == ["user1", "user3"]
+        assert factory.get_manager("user1") is manager1
+
+    def test_cached_lookup_does_not_wait_for_lock(self):
+        """Test a cached manager is returned while another thread holds the lock"""
+        factory = ManagerFactory()
+        manager = factory.get_manager("user1")
+
+        with factory._lock:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(factory.get_manager, "user1")
+                assert future.result(timeout=5) is manager
+
+    @pytest.mark.asyncio
+    async def test_evicted_manager_is_flushed_and_closed(self):
+        """Test eviction writes pending drafts and closes the artifact store"""
+        factory = ManagerFactory(max_users=1)
+        manager = factory.get_manager("evicted_user")
+        manager.auto_flush = False
+        await manager._ensure_artifact_store()
+        store = manager._artifact_store
+        draft = manager.create_draft("Pending", "text")
+
+        try:
+            factory.get_manager("newer_user")
+            await asyncio.sleep(0)
+
+            assert (manager.storage_path / f"{draft.draft_id}.json").exists()
+            assert store._closed
+            assert manager._artifact_initialized is False
+        finally:
+            manager.delete_draft(draft.draft_id)
+
+    def test_concurrent_get_manager_returns_single_instance(self):
+        """Test concurrent first lookups for one user share a single manager"""
+        factory = ManagerFactory()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            managers = list(executor.map(factory.get_manager, ["user1"] * 32))
+
+        assert all(manager is managers[0] for manager in managers)
+        assert factory.get_active_users() == ["user1"]
+
+    def test_concurrent_get_manager_past_max_users(self):
+        """Test concurrent lookups for more users than max_users keep the cache bounded"""
+        factory = ManagerFactory(max_users=4)
+        user_ids = [f"lru_user{i % 12}" for i in range(96)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            managers = list(executor.map(factory.get_manager, user_ids))
+
+        assert all(manager.user_id == user_id for manager, user_id in zip(managers, user_ids))
+        active_users = factory.get_active_users()
+        assert len(active_users) == 4
+        for user_id in active_users:
+            assert factory.get_manager(user_id) is factory._managers[user_id]
+
 
 class TestGlobalFactory:
     """Test global factory functions"""
 
     def test_get_factory_creates_default(self):
         """Test get_factory creates default factory if not set"""
-        # Reset global factory
-        from chuk_mcp_linkedin import manager_factory
-
-        manager_factory._global_factory = None
-
         # Get factory
         factory = get_factory()
 
@@ -207,6 +279,13 @@ class TestGlobalFactory:
 
         assert factory1 is factory2
 
+    def test_get_factory_concurrent_first_use(self):
+        """Test threads racing on first use share one default factory"""
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            factories = list(pool.map(lambda _: get_factory(), range(32)))
+
+        assert all(factory is factories[0] for factory in factories)
+
 
 class TestGetManagerForUser:
     """Test get_manager_for_user function"""
@@ -245,6 +324,18 @@ class TestGetManagerForUser:
             # Clean up context
             clear_all()
 
+    def test_get_manager_for_user_resolves_context_per_call(self, monkeypatch):
+        """Test a patched require_user_id takes effect after earlier calls"""
+        from chuk_mcp_server import context
+
+        set_factory(ManagerFactory())
+
+        monkeypatch.setattr(context, "require_user_id", lambda: "patched_user1")
+        assert get_manager_for_user().user_id == "patched_user1"
+
+        monkeypatch.setattr(context, "require_user_id", lambda: "patched_user2")
+        assert get_manager_for_user().user_id == "patched_user2"
+
     def test_get_manager_for_user_raises_when_no_user(self):
         """Test get_manager_for_user raises when no user_id"""
         from chuk_mcp_server.context import clear_all
@@ -1,5 +1,8 @@
 """Tests for Pydantic data models."""
 
+import subprocess
+import sys
+
 import pytest
 from pydantic import ValidationError
 
@@ -41,6 +44,15 @@ class TestBarChartData:
         with pytest.raises(ValidationError):
             BarChartData(data={"A": "not an int"})
 
+    def test_instances_are_frozen(self):
+        data = BarChartData(data={"A": 10})
+        with pytest.raises(ValidationError):
+            data.title = "Changed"
+
+    def test_unknown_fields_fail(self):
+        with pytest.raises(ValidationError):
+            BarChartData(data={"A": 10}, colour="red")
+
 
 class TestMetricsChartData:
     def test_valid_data(self):
@@ -189,6 +201,10 @@ class TestProConData:
         with pytest.raises(ValidationError, match="cannot be empty"):
             ProConData(pros=[""], cons=["Con"])
 
+    def test_blank_item_error_names_field(self):
+        with pytest.raises(ValidationError, match="Items in 'cons' cannot be empty"):
+            ProConData(pros=["Pro"], cons=["   "])
+
 
 class TestChecklistData:
     def test_valid_data(self):
@@ -348,3 +364,27 @@ class TestModelsInit:
     def test_all_models_importable(self):
         # If we get here, all imports succeeded
         assert True
+
+    def test_all_exports_resolve(self):
+        """Every name in __all__ resolves lazily to a model class"""
+        import chuk_mcp_linkedin.models as models
+
+        for name in models.__all__:
+            assert getattr(models, name).__name__ == name
+
+    def test_unknown_attribute_raises(self):
+        import chuk_mcp_linkedin.models as models
+
+        with pytest.raises(AttributeError):
+            models.DoesNotExist  # noqa: B018
+
+    def test_package_import_does_not_load_models(self):
+        """Importing the models package defers building the model classes"""
+        code = (
+            "import sys, chuk_mcp_linkedin.models; "
+            "print('chuk_mcp_linkedin.models.content_models' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
@@ -0,0 +1,42 @@
+"""Tests for the top-level package lazy exports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import chuk_mcp_linkedin
+
+
+class TestLazyExports:
+    """Test PEP 562 lazy attribute resolution on the package"""
+
+    def test_all_exports_resolve(self):
+        """Every name in __all__ resolves to an object"""
+        for name in chuk_mcp_linkedin.__all__:
+            assert getattr(chuk_mcp_linkedin, name) is not None
+
+    def test_export_is_cached_in_globals(self):
+        """Resolved names are stored on the module after first access"""
+        manager_cls = chuk_mcp_linkedin.LinkedInManager
+        assert vars(chuk_mcp_linkedin)["LinkedInManager"] is manager_cls
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names raise AttributeError"""
+        with pytest.raises(AttributeError):
+            chuk_mcp_linkedin.DoesNotExist  # noqa: B018
+
+    def test_dir_includes_lazy_names(self):
+        """dir() lists lazy exports before they are accessed"""
+        assert "LinkedInPreview" in dir(chuk_mcp_linkedin)
+
+    def test_submodule_import_does_not_load_manager(self):
+        """Importing a lightweight submodule does not import the manager"""
+        code = (
+            "import sys, chuk_mcp_linkedin.tokens; "
+            "print('chuk_mcp_linkedin.manager' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
@@ -558,6 +558,20 @@ class TestLinkedInPreview:
         assert "<script>" not in result
         assert "&lt;script&gt;" in result
 
+    def test_format_content_escapes_around_hashtags(self):
+        """Test escaping and hashtag highlighting in the same text"""
+        text = 'Tom & "Jerry" <3 #Cartoons'
+        result = LinkedInPreview._format_content(text)
+        assert result == (
+            'Tom &amp; &quot;Jerry&quot; &lt;3 <span class="hashtag">#Cartoons</span>'
+        )
+
+    def test_format_content_placeholder_text_untouched(self):
+        """Test literal placeholder-like text is not treated as a hashtag"""
+        text = "__HASHTAG_0__ #Real"
+        result = LinkedInPreview._format_content(text)
+        assert result.startswith("__HASHTAG_0__ ")
+
     def test_render_media_attachments_images(self):
         """Test rendering image attachments"""
         content = {"images": [{"filepath": "/path/to/image.jpg", "alt_text": "Test image"}]}